@@ -1,16 +1,60 @@
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, Response
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
+from os import environ as _env_map
 import logging
-import os
+import orjson
+import re
+
+from app.backend.routes.errors import handle_errors
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/config", tags=["config"])
 
+# Ticker symbols are 1-10 uppercase ASCII letters/digits
+_TICKER_RE = re.compile(r"\A[A-Z0-9]{1,10}\Z").match
+
+_AZ_CLI_TEMPLATE = """az functionapp config appsettings set \\
+    --name aihedgefund-monitor \\
+    --resource-group rg-ai-hedge-fund-prod \\
+    --settings \\
+        MARKET_MONITOR_WATCHLIST="{watchlist}" \\
+        MARKET_MONITOR_PERCENT_CHANGE_THRESHOLD="{price_threshold}" \\
+        MARKET_MONITOR_VOLUME_SPIKE_MULTIPLIER="{volume_multiplier}" \\
+        MARKET_MONITOR_COOLDOWN_SECONDS="{cooldown}" \\
+        MARKET_MONITOR_VOLUME_LOOKBACK="{volume_lookback}"
+""".format
+
+_DEFAULT_WATCHLIST = "AAPL,MSFT,NVDA,GOOGL,TSLA"
+
+_VALID_TRADE_MODES = frozenset({"paper", "analysis"})
+
+# Constant head of the update_monitor_config response, serialized once. The
+# trailing "}" is dropped so the per-request fields can be appended.
+_MONITOR_READY_PREFIX = orjson.dumps({
+    "status": "configuration_ready",
+    "message": "Configuration validated. Apply these settings to your Function App.",
+})[:-1]
+
+_MONITOR_ENV_KEYS = (
+    "MARKET_MONITOR_WATCHLIST",
+    "MARKET_MONITOR_PERCENT_CHANGE_THRESHOLD",
+    "MARKET_MONITOR_VOLUME_SPIKE_MULTIPLIER",
+    "MARKET_MONITOR_COOLDOWN_SECONDS",
+    "MARKET_MONITOR_VOLUME_LOOKBACK",
+)
+
 
 class MarketMonitorConfig(BaseModel):
     """Market monitor configuration schema."""
+    # Defer core-schema construction until first validation so importing the
+    # router does not pay the Pydantic build cost on cold start. The JSON schema
+    # is only walked when /openapi.json is first requested; FastAPI caches the
+    # result on app.openapi_schema, so it is not pre-computed here.
+    model_config = ConfigDict(defer_build=True)
+
     watchlist: List[str] = Field(..., description="List of ticker symbols to monitor")
     price_breakout_threshold: float = Field(0.02, ge=0.01, le=0.10, description="Price change threshold (e.g., 0.02 = 2%)")
     volume_spike_multiplier: float = Field(1.5, ge=1.0, le=5.0, description="Volume spike multiplier")
@@ -20,13 +64,60 @@ class MarketMonitorConfig(BaseModel):
 
 class TradingConfig(BaseModel):
     """Trading configuration schema."""
+    model_config = ConfigDict(defer_build=True)
+
     confidence_threshold: int = Field(70, ge=0, le=100, description="Minimum confidence to execute trades")
     trade_mode: str = Field("paper", description="Trading mode: 'paper' or 'analysis'")
     dry_run: bool = Field(False, description="Simulate trades without executing")
     enabled_agents: Optional[List[str]] = Field(None, description="List of enabled agent names")
 
 
+@lru_cache(maxsize=8)
+def _parse_bool(value: str) -> bool:
+    """Parse an environment flag using the repo-wide ``"true"`` convention."""
+    return value.strip().lower() == "true"
+
+
+def _parse_watchlist(watchlist_str: str) -> list[str]:
+    """Split a comma-separated watchlist into stripped ticker symbols."""
+    return [ticker.strip() for ticker in watchlist_str.split(",")]
+
+
+@lru_cache(maxsize=1)
+def _build_monitor_config(
+    watchlist_str: str,
+    price_threshold: str,
+    volume_multiplier: str,
+    cooldown: str,
+    volume_lookback: str,
+) -> MarketMonitorConfig:
+    """Parse raw environment values into a monitor config.
+
+    Keyed on the raw strings so repeated requests reuse the parsed model
+    until the Function App settings change.
+    """
+    return MarketMonitorConfig(
+        watchlist=_parse_watchlist(watchlist_str),
+        price_breakout_threshold=float(price_threshold),
+        volume_spike_multiplier=float(volume_multiplier),
+        cooldown_seconds=int(cooldown),
+        volume_lookback_days=int(volume_lookback)
+    )
+
+
+@lru_cache(maxsize=1)
+def _build_trading_config(confidence_threshold: str, trade_mode: str, dry_run: str) -> TradingConfig:
+    """Parse raw environment values into a trading config."""
+    return TradingConfig(
+        confidence_threshold=int(confidence_threshold),
+        trade_mode=trade_mode,
+        dry_run=_parse_bool(dry_run),
+        enabled_agents=None  # All agents enabled by default
+    )
+
+
 @router.get("/monitor")
+@handle_errors("Error reading monitor config", "Failed to read config")
 async def get_monitor_config() -> MarketMonitorConfig:
     """
     Get current market monitor configuration.
@@ -34,29 +125,18 @@ async def get_monitor_config() -> MarketMonitorConfig:
     This reads from environment variables and returns the current settings
     for the Function App market monitor.
     """
-    try:
-        # Read from environment variables
-        watchlist_str = os.getenv("MARKET_MONITOR_WATCHLIST", "AAPL,MSFT,NVDA,GOOGL,TSLA")
-        watchlist = [ticker.strip() for ticker in watchlist_str.split(",")]
-
-        price_threshold = float(os.getenv("MARKET_MONITOR_PERCENT_CHANGE_THRESHOLD", "0.02"))
-        volume_multiplier = float(os.getenv("MARKET_MONITOR_VOLUME_SPIKE_MULTIPLIER", "1.5"))
-        cooldown = int(os.getenv("MARKET_MONITOR_COOLDOWN_SECONDS", "1800"))
-        volume_lookback = int(os.getenv("MARKET_MONITOR_VOLUME_LOOKBACK", "10"))
-
-        return MarketMonitorConfig(
-            watchlist=watchlist,
-            price_breakout_threshold=price_threshold,
-            volume_spike_multiplier=volume_multiplier,
-            cooldown_seconds=cooldown,
-            volume_lookback_days=volume_lookback
-        )
-    except Exception as e:
-        logger.error(f"Error reading monitor config: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to read config: {str(e)}")
+    # Read from environment variables; parsing is cached on the raw values
+    return _build_monitor_config(
+        _env_map.get("MARKET_MONITOR_WATCHLIST", _DEFAULT_WATCHLIST),
+        _env_map.get("MARKET_MONITOR_PERCENT_CHANGE_THRESHOLD", "0.02"),
+        _env_map.get("MARKET_MONITOR_VOLUME_SPIKE_MULTIPLIER", "1.5"),
+        _env_map.get("MARKET_MONITOR_COOLDOWN_SECONDS", "1800"),
+        _env_map.get("MARKET_MONITOR_VOLUME_LOOKBACK", "10"),
+    )
 
 
 @router.put("/monitor")
+@handle_errors("Error validating config", "Failed to update config")
 async def update_monitor_config(config: MarketMonitorConfig):
     """
     Update market monitor configuration.
@@ -82,76 +162,58 @@ async def update_monitor_config(config: MarketMonitorConfig):
     Returns:
         Configuration that should be applied
     """
-    try:
-        # Validate watchlist
-        if not config.watchlist or len(config.watchlist) == 0:
-            raise HTTPException(status_code=400, detail="Watchlist cannot be empty")
-
-        # Validate all tickers are uppercase and alphanumeric
-        validated_watchlist = []
-        for ticker in config.watchlist:
-            ticker = ticker.strip().upper()
-            if not ticker.isalnum():
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid ticker symbol: {ticker}"
-                )
-            validated_watchlist.append(ticker)
-
-        # Return the configuration for manual application
-        return {
-            "status": "configuration_ready",
-            "message": "Configuration validated. Apply these settings to your Function App.",
-            "environment_variables": {
-                "MARKET_MONITOR_WATCHLIST": ",".join(validated_watchlist),
-                "MARKET_MONITOR_PERCENT_CHANGE_THRESHOLD": str(config.price_breakout_threshold),
-                "MARKET_MONITOR_VOLUME_SPIKE_MULTIPLIER": str(config.volume_spike_multiplier),
-                "MARKET_MONITOR_COOLDOWN_SECONDS": str(config.cooldown_seconds),
-                "MARKET_MONITOR_VOLUME_LOOKBACK": str(config.volume_lookback_days)
-            },
-            "azure_cli_command": f"""az functionapp config appsettings set \\
-    --name aihedgefund-monitor \\
-    --resource-group rg-ai-hedge-fund-prod \\
-    --settings \\
-        MARKET_MONITOR_WATCHLIST="{','.join(validated_watchlist)}" \\
-        MARKET_MONITOR_PERCENT_CHANGE_THRESHOLD="{config.price_breakout_threshold}" \\
-        MARKET_MONITOR_VOLUME_SPIKE_MULTIPLIER="{config.volume_spike_multiplier}" \\
-        MARKET_MONITOR_COOLDOWN_SECONDS="{config.cooldown_seconds}" \\
-        MARKET_MONITOR_VOLUME_LOOKBACK="{config.volume_lookback_days}"
-"""
-        }
+    # Validate watchlist
+    if not config.watchlist or len(config.watchlist) == 0:
+        raise HTTPException(status_code=400, detail="Watchlist cannot be empty")
+
+    # Validate all tickers are uppercase and alphanumeric
+    validated_watchlist = [ticker.strip().upper() for ticker in config.watchlist]
+    invalid = [ticker for ticker in validated_watchlist if not _TICKER_RE(ticker)]
+    if invalid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid ticker symbols: {','.join(invalid[:10])}"
+        )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error validating config: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to update config: {str(e)}")
+    watchlist_csv = ",".join(validated_watchlist)
+
+    # Return the configuration for manual application
+    tail = orjson.dumps({
+        "environment_variables": dict(zip(_MONITOR_ENV_KEYS, (
+            watchlist_csv,
+            str(config.price_breakout_threshold),
+            str(config.volume_spike_multiplier),
+            str(config.cooldown_seconds),
+            str(config.volume_lookback_days)
+        ))),
+        "azure_cli_command": _AZ_CLI_TEMPLATE(
+            watchlist=watchlist_csv,
+            price_threshold=config.price_breakout_threshold,
+            volume_multiplier=config.volume_spike_multiplier,
+            cooldown=config.cooldown_seconds,
+            volume_lookback=config.volume_lookback_days
+        )
+    })
+    return Response(content=_MONITOR_READY_PREFIX + b"," + tail[1:], media_type="application/json")
 
 
 @router.get("/trading")
+@handle_errors("Error reading trading config", "Failed to read config")
 async def get_trading_config() -> TradingConfig:
     """
     Get current trading configuration defaults.
 
     Returns the default trading settings used by the queue worker.
     """
-    try:
-        confidence_threshold = int(os.getenv("CONFIDENCE_THRESHOLD", "70"))
-        trade_mode = os.getenv("TRADE_MODE", "paper")
-        dry_run = os.getenv("DRY_RUN", "false").lower() == "true"
-
-        return TradingConfig(
-            confidence_threshold=confidence_threshold,
-            trade_mode=trade_mode,
-            dry_run=dry_run,
-            enabled_agents=None  # All agents enabled by default
-        )
-    except Exception as e:
-        logger.error(f"Error reading trading config: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to read config: {str(e)}")
+    return _build_trading_config(
+        _env_map.get("CONFIDENCE_THRESHOLD", "70"),
+        _env_map.get("TRADE_MODE", "paper"),
+        _env_map.get("DRY_RUN", "false"),
+    )
 
 
 @router.put("/trading")
+@handle_errors("Error validating trading config", "Failed to update config")
 async def update_trading_config(config: TradingConfig):
     """
     Update trading configuration.
@@ -165,27 +227,20 @@ async def update_trading_config(config: TradingConfig):
     Returns:
         Configuration to be applied
     """
-    try:
-        # Validate trade mode
-        if config.trade_mode not in ["paper", "analysis"]:
-            raise HTTPException(
-                status_code=400,
-                detail="trade_mode must be 'paper' or 'analysis'"
-            )
-
-        return {
-            "status": "configuration_ready",
-            "message": "Trading configuration validated.",
-            "environment_variables": {
-                "CONFIDENCE_THRESHOLD": str(config.confidence_threshold),
-                "TRADE_MODE": config.trade_mode,
-                "DRY_RUN": str(config.dry_run).lower()
-            },
-            "note": "These settings apply to future queue worker executions"
-        }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error validating trading config: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to update config: {str(e)}")
+    # Validate trade mode
+    if config.trade_mode not in _VALID_TRADE_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail="trade_mode must be 'paper' or 'analysis'"
+        )
+
+    return {
+        "status": "configuration_ready",
+        "message": "Trading configuration validated.",
+        "environment_variables": {
+            "CONFIDENCE_THRESHOLD": str(config.confidence_threshold),
+            "TRADE_MODE": config.trade_mode,
+            "DRY_RUN": str(config.dry_run).lower()
+        },
+        "note": "These settings apply to future queue worker executions"
+    }
@@ -1,17 +1,59 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from functools import lru_cache
 from typing import Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+import hashlib
 import logging
+import orjson
 
+from app.backend.routes.errors import handle_errors
 from app.backend.services.dashboard_service import DashboardService
+from app.backend.services.response_cache import ttl_cache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 
+@lru_cache(maxsize=1)
+def get_dashboard_service() -> DashboardService:
+    """Return the process-wide dashboard service shared by all requests."""
+    return DashboardService()
+
+
+def _has_trade_filters(params: dict) -> bool:
+    """Only unfiltered trade pages are cached; filtered queries are too varied."""
+    return any(params.get(name) for name in ("ticker", "action", "start_date", "end_date", "cursor"))
+
+
+def _etag_response(request: Request, payload: dict, version: bytes) -> Response:
+    """
+    Return ``payload`` with an ETag derived from ``version``.
+
+    Answers 304 Not Modified with an empty body when the client already holds
+    the same version (If-None-Match), so repeated polls skip serialization.
+    """
+    etag = f'"{hashlib.blake2b(version, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=10"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(payload, headers=headers)
+
+
+@ttl_cache(ttl=60)
+async def _load_performance_metrics(service: DashboardService, days: int) -> dict:
+    return await service.get_performance_metrics(days)
+
+
+@ttl_cache(ttl=60)
+async def _load_portfolio_history(service: DashboardService, days: int) -> dict:
+    return await service.get_portfolio_history(days)
+
+
 @router.get("/portfolio")
-async def get_portfolio_summary():
+@handle_errors("Error fetching portfolio summary", "Failed to fetch portfolio")
+async def get_portfolio_summary(service: DashboardService = Depends(get_dashboard_service)):
     """
     Get current portfolio summary from Alpaca Paper Trading API.
 
@@ -21,17 +63,16 @@ async def get_portfolio_summary():
         - Buying power
         - Current positions with P&L
     """
-    try:
-        service = DashboardService()
-        portfolio = await service.get_portfolio_summary()
-        return portfolio
-    except Exception as e:
-        logger.error(f"Error fetching portfolio summary: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to fetch portfolio: {str(e)}")
+    return await service.get_portfolio_summary()
 
 
 @router.get("/metrics")
-async def get_performance_metrics(days: int = Query(30, ge=1, le=365)):
+@handle_errors("Error calculating performance metrics", "Failed to calculate metrics")
+async def get_performance_metrics(
+    request: Request,
+    days: int = Query(30, ge=1, le=365),
+    service: DashboardService = Depends(get_dashboard_service)
+):
     """
     Get trading performance metrics over the specified time period.
 
@@ -47,23 +88,24 @@ async def get_performance_metrics(days: int = Query(30, ge=1, le=365)):
         - Total return
         - Max drawdown
     """
-    try:
-        service = DashboardService()
-        metrics = await service.get_performance_metrics(days)
-        return metrics
-    except Exception as e:
-        logger.error(f"Error calculating performance metrics: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to calculate metrics: {str(e)}")
+    metrics = await _load_performance_metrics(service, days)
+    # Metrics are a small dict; version on everything except the refresh stamp
+    version = orjson.dumps({k: v for k, v in metrics.items() if k != "last_updated"})
+    return _etag_response(request, metrics, version)
 
 
 @router.get("/trades")
+@handle_errors("Error fetching trade history", "Failed to fetch trades")
+@ttl_cache(ttl=10, ignore=("service",), unless=_has_trade_filters)
 async def get_trade_history(
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
-    ticker: Optional[str] = None,
+    ticker: Optional[str] = Query(None, pattern=r"^[A-Za-z0-9]{1,10}$"),
     action: Optional[str] = None,
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    cursor: Optional[str] = Query(None, max_length=128),
+    service: DashboardService = Depends(get_dashboard_service)
 ):
     """
     Get trade history from Cosmos DB broker-orders container.
@@ -75,28 +117,32 @@ async def get_trade_history(
         action: Filter by action (buy, sell, short) (optional)
         start_date: Filter by start date (YYYY-MM-DD) (optional)
         end_date: Filter by end date (YYYY-MM-DD) (optional)
+        cursor: next_cursor from the previous page; replaces offset (optional)
 
     Returns:
         List of trades with details and pagination info
     """
-    try:
-        service = DashboardService()
-        trades = await service.get_trade_history(
-            limit=limit,
-            offset=offset,
-            ticker=ticker,
-            action=action,
-            start_date=start_date,
-            end_date=end_date
-        )
-        return trades
-    except Exception as e:
-        logger.error(f"Error fetching trade history: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to fetch trades: {str(e)}")
+    trades = await service.get_trade_history(
+        limit=limit,
+        offset=offset,
+        ticker=ticker,
+        action=action,
+        start_date=start_date,
+        end_date=end_date,
+        cursor=cursor
+    )
+    # Encode the (up to 500) raw Cosmos documents with orjson directly,
+    # skipping FastAPI's per-field jsonable_encoder pass.
+    return ORJSONResponse(trades)
 
 
 @router.get("/agent-performance")
-async def get_agent_performance(days: int = Query(30, ge=1, le=365)):
+@handle_errors("Error fetching agent performance", "Failed to fetch agent performance")
+@ttl_cache(ttl=60, ignore=("service",))
+async def get_agent_performance(
+    days: int = Query(30, ge=1, le=365),
+    service: DashboardService = Depends(get_dashboard_service)
+):
     """
     Get AI agent performance leaderboard.
 
@@ -114,17 +160,13 @@ async def get_agent_performance(days: int = Query(30, ge=1, le=365)):
         - Average confidence
         - P&L contribution
     """
-    try:
-        service = DashboardService()
-        leaderboard = await service.get_agent_performance(days)
-        return leaderboard
-    except Exception as e:
-        logger.error(f"Error fetching agent performance: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to fetch agent performance: {str(e)}")
+    return await service.get_agent_performance(days)
 
 
 @router.get("/system-health")
-async def get_system_health():
+@handle_errors("Error fetching system health", "Failed to fetch system health")
+@ttl_cache(ttl=10, ignore=("service",))
+async def get_system_health(service: DashboardService = Depends(get_dashboard_service)):
     """
     Get system health and operational metrics.
 
@@ -135,17 +177,16 @@ async def get_system_health():
         - Failed analyses count
         - LLM cost tracking (if LangSmith enabled)
     """
-    try:
-        service = DashboardService()
-        health = await service.get_system_health()
-        return health
-    except Exception as e:
-        logger.error(f"Error fetching system health: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to fetch system health: {str(e)}")
+    return await service.get_system_health()
 
 
 @router.get("/portfolio-history")
-async def get_portfolio_history(days: int = Query(30, ge=1, le=365)):
+@handle_errors("Error fetching portfolio history", "Failed to fetch portfolio history")
+async def get_portfolio_history(
+    request: Request,
+    days: int = Query(30, ge=1, le=365),
+    service: DashboardService = Depends(get_dashboard_service)
+):
     """
     Get historical portfolio values for charting.
 
@@ -155,10 +196,8 @@ async def get_portfolio_history(days: int = Query(30, ge=1, le=365)):
     Returns:
         Array of {date, value} objects for portfolio value over time
     """
-    try:
-        service = DashboardService()
-        history = await service.get_portfolio_history(days)
-        return history
-    except Exception as e:
-        logger.error(f"Error fetching portfolio history: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to fetch portfolio history: {str(e)}")
+    history = await _load_portfolio_history(service, days)
+    # History is sorted ascending, so the newest point identifies the series
+    points = history.get("history") or [{}]
+    version = f"{days}:{len(points)}:{points[-1].get('date')}:{history.get('error')}".encode()
+    return _etag_response(request, history, version)
@@ -0,0 +1,30 @@
+import functools
+import logging
+
+from fastapi import HTTPException
+
+
+def handle_errors(log_message: str, detail: str):
+    """
+    Convert unexpected exceptions raised by an async route into a 500 response.
+
+    HTTPExceptions raised by the route pass through untouched; anything else is
+    logged on the route module's logger as ``"<log_message>: <error>"`` and
+    re-raised as ``HTTPException(500, "<detail>: <error>")``.
+    """
+    def decorator(func):
+        logger = logging.getLogger(func.__module__)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.error("%s: %s", log_message, e)
+                raise HTTPException(status_code=500, detail=f"{detail}: {str(e)}")
+
+        return wrapper
+
+    return decorator
@@ -9,7 +9,7 @@ from uuid import uuid4
 from src.tools.api import (
     get_company_news,
     get_price_data,
-    get_prices,
+    get_prices_batch,
     get_financial_metrics,
     get_insider_trades,
 )
@@ -265,15 +265,16 @@ class BacktestService:
 
         return total_value
 
-    def prefetch_data(self):
+    async def prefetch_data(self):
         """Pre-fetch all data needed for the backtest period."""
         end_date_dt = datetime.strptime(self.end_date, "%Y-%m-%d")
         start_date_dt = end_date_dt - relativedelta(years=1)
         start_date_str = start_date_dt.strftime("%Y-%m-%d")
         api_key = self.request.api_keys.get("FINANCIAL_DATASETS_API_KEY")
 
+        await get_prices_batch(self.tickers, start_date_str, self.end_date, api_key=api_key)
+
         for ticker in self.tickers:
-            get_prices(ticker, start_date_str, self.end_date, api_key=api_key)
             get_financial_metrics(ticker, self.end_date, limit=10, api_key=api_key)
             get_insider_trades(ticker, self.end_date, start_date=self.start_date, limit=1000, api_key=api_key)
             get_company_news(ticker, self.end_date, start_date=self.start_date, limit=1000, api_key=api_key)
@@ -331,7 +332,7 @@ class BacktestService:
         Uses the pre-compiled graph for trading decisions.
         """
         # Pre-fetch all data at the start
-        self.prefetch_data()
+        await self.prefetch_data()
 
         dates = pd.date_range(self.start_date, self.end_date, freq="B")
         performance_metrics = {
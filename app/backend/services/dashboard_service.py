@@ -3,53 +3,287 @@ Dashboard service for fetching and calculating trading analytics.
 """
 import os
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Dict, List, Any, AsyncIterator
 import asyncio
 from collections import defaultdict
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+from dotenv import load_dotenv
+
+from app.backend.services.response_cache import ttl_cache
+from src.data.cosmos_repository import CosmosRepository
 
 logger = logging.getLogger(__name__)
 
+# Configuration is read once at import rather than on every request
+load_dotenv()
+
+_COSMOS_AVAILABLE = bool(
+    os.getenv("COSMOS_ENDPOINT") and
+    os.getenv("COSMOS_KEY") and
+    os.getenv("COSMOS_DATABASE")
+)
+_ALPACA_AVAILABLE = bool(
+    os.getenv("APCA_API_KEY_ID") and
+    os.getenv("APCA_API_SECRET_KEY")
+)
+_DASHBOARD_PARTITION_KEY = os.getenv("COSMOS_DASHBOARD_PARTITION_KEY") or None
+
+_QUEUE_ACCOUNT = os.getenv("QUEUE_ACCOUNT")
+_QUEUE_NAME = os.getenv("QUEUE_NAME")
+_QUEUE_SAS = os.getenv("QUEUE_SAS", "")
+_QUEUE_URL = (
+    f"https://{_QUEUE_ACCOUNT}.queue.core.windows.net/{_QUEUE_NAME}"
+    if _QUEUE_ACCOUNT and _QUEUE_NAME else None
+)
+
+# Trade fields the dashboard renders (see Trade in dashboard/src/lib/api.ts)
+_TRADE_FIELDS = ", ".join(
+    f"c.{field}" for field in
+    ("id", "timestamp", "ticker", "action", "quantity", "price", "status", "confidence")
+)
+
+# Read-only templates for the "not configured" / error responses; each
+# return copies one with {**template, ...} rather than rebuilding the literal
+_EMPTY_PORTFOLIO = MappingProxyType({
+    "total_value": 0,
+    "cash": 0,
+    "positions_value": 0,
+    "buying_power": 0,
+    "positions": ()
+})
+_EMPTY_METRICS = MappingProxyType({"total_trades": 0, "win_rate": 0})
+_NO_TRADE_METRICS = MappingProxyType({
+    **_EMPTY_METRICS,
+    "wins": 0,
+    "losses": 0,
+    "avg_win": 0,
+    "avg_loss": 0,
+    "profit_factor": 0
+})
+_EMPTY_TRADES = MappingProxyType({"trades": (), "total": 0})
+_EMPTY_AGENTS = MappingProxyType({"agents": ()})
+_EMPTY_HISTORY = MappingProxyType({"history": ()})
+
+# Same annual risk-free rate the backtester uses for Sharpe
+_DAILY_RISK_FREE_RATE = 0.0434 / 252
+
+
+def _snapshot_values(snapshots: List[Dict[str, Any]]) -> tuple:
+    """
+    Value projected portfolio snapshots (``timestamp``, ``cash``, ``positions``).
+
+    Every position of every snapshot is flattened into one array and
+    quantity * price is summed per snapshot in a single vectorized pass.
+
+    Returns:
+        ``(cash, positions_value)`` float arrays, one entry per snapshot
+    """
+    positions = [list((snapshot.get("positions") or {}).values()) for snapshot in snapshots]
+    owner = np.repeat(np.arange(len(snapshots)), [len(p) for p in positions])
+    flat = [pos for snapshot_positions in positions for pos in snapshot_positions]
+    quantity = np.fromiter((pos.get("quantity", 0) for pos in flat), dtype=float, count=len(flat))
+    price = np.fromiter((pos.get("current_price", 0) for pos in flat), dtype=float, count=len(flat))
+    positions_value = np.bincount(owner, weights=quantity * price, minlength=len(snapshots)).astype(float)
+    cash = np.fromiter((snapshot.get("cash", 0) for snapshot in snapshots), dtype=float, count=len(snapshots))
+    return cash, positions_value
+
+
+def _daily_closes(snapshots: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Keep the last snapshot of each date from oldest-first ``snapshots``.
+
+    Writers snapshot once per run, so a day can hold several points; the
+    daily Sharpe annualization needs exactly one.
+    """
+    # ISO timestamps start with the date; later snapshots overwrite earlier ones
+    by_date = {str(snapshot.get("timestamp", ""))[:10]: snapshot for snapshot in snapshots}
+    return list(by_date.values())
+
+
+@lru_cache(maxsize=1)
+def _cosmos_repository() -> CosmosRepository:
+    """Return the process-wide Cosmos repository (one SDK client per process)."""
+    return CosmosRepository.from_environment()
+
+
+@lru_cache(maxsize=None)
+def _cosmos_container(name: str) -> Any:
+    """
+    Return the shared ContainerProxy for ``name``.
+
+    The underlying client does its TLS handshake and account discovery on
+    first use; every later request reuses the same connection pool.
+    """
+    return _cosmos_repository()._database.get_container_client(name)
+
+
+def _next_page(pages: Any) -> Optional[List[Any]]:
+    """Pull the next Cosmos result page, or None once the query is exhausted."""
+    page = next(pages, None)
+    return None if page is None else list(page)
+
+
+def _equity_metrics(equity: np.ndarray) -> Dict[str, float]:
+    """
+    Total return, annualized Sharpe ratio and max drawdown of an equity curve.
+
+    Follows the backtester's conventions: one point per trading day (see
+    _daily_closes), returns and drawdown in percent, drawdown reported as a
+    negative number.
+    """
+    if len(equity) < 3 or equity.min() <= 0:
+        return {"total_return": 0, "sharpe_ratio": 0, "max_drawdown": 0}
+
+    # Work in place on one returns buffer and one peak buffer so long
+    # histories allocate two arrays rather than one per operation
+    excess_returns = np.diff(equity)
+    excess_returns /= equity[:-1]
+    excess_returns -= _DAILY_RISK_FREE_RATE
+    std = excess_returns.std(ddof=1)
+    sharpe_ratio = np.sqrt(252) * excess_returns.mean() / std if std > 1e-12 else 0.0
+
+    # (equity - peak) / peak == equity / peak - 1, so its minimum is one ratio pass
+    peak = np.maximum.accumulate(equity)
+    np.divide(equity, peak, out=peak)
+    max_drawdown = (peak.min() - 1) * 100
+
+    return {
+        "total_return": round(float((equity[-1] / equity[0] - 1) * 100), 2),
+        "sharpe_ratio": round(float(sharpe_ratio), 2),
+        "max_drawdown": round(float(max_drawdown), 2)
+    }
+
 
 class DashboardService:
     """Service for dashboard data aggregation and analytics."""
 
-    def __init__(self):
-        """Initialize the dashboard service."""
-        self.cosmos_available = self._check_cosmos_available()
-        self.alpaca_available = self._check_alpaca_available()
-
-    def _check_cosmos_available(self) -> bool:
-        """Check if Cosmos DB credentials are configured."""
-        return bool(
-            os.getenv("COSMOS_ENDPOINT") and
-            os.getenv("COSMOS_KEY") and
-            os.getenv("COSMOS_DATABASE")
+    def __init__(self, partition_key: Optional[str] = None):
+        """
+        Initialize the dashboard service.
+
+        Args:
+            partition_key: ``{user_id}::{strategy_id}`` partition to scope
+                analyst-signal and snapshot queries to. Defaults to
+                COSMOS_DASHBOARD_PARTITION_KEY; when unset, queries fan out
+                across all partitions.
+        """
+        self.cosmos_available = _COSMOS_AVAILABLE
+        self.alpaca_available = _ALPACA_AVAILABLE
+        self.partition_key = partition_key or _DASHBOARD_PARTITION_KEY
+        self._partition_paths: Dict[str, Optional[str]] = {}
+
+    async def _query_items(
+        self,
+        container: Any,
+        query: str,
+        parameters: Optional[List[Dict[str, Any]]] = None,
+        partition_key: Optional[str] = None,
+        **options: Any
+    ) -> List[Any]:
+        """
+        Run a Cosmos query in a worker thread so the event loop is not blocked.
+
+        With a ``partition_key`` the query targets that single logical
+        partition, so Cosmos can use Optimistic Direct Execution and skip the
+        client-side query plan; without one it fans out across partitions.
+        """
+        if partition_key is not None:
+            options["partition_key"] = partition_key
+        else:
+            options["enable_cross_partition_query"] = True
+        return await asyncio.to_thread(
+            lambda: list(container.query_items(
+                query=query,
+                parameters=parameters,
+                **options
+            ))
         )
 
-    def _check_alpaca_available(self) -> bool:
-        """Check if Alpaca credentials are configured."""
-        return bool(
-            os.getenv("APCA_API_KEY_ID") and
-            os.getenv("APCA_API_SECRET_KEY")
+    async def _query_pages(
+        self,
+        container: Any,
+        query: str,
+        parameters: Optional[List[Dict[str, Any]]] = None,
+        partition_key: Optional[str] = None,
+        page_size: int = 1000
+    ) -> AsyncIterator[List[Any]]:
+        """
+        Yield query results one Cosmos page at a time.
+
+        Used by aggregations so only a single page of documents is held in
+        memory; each page is fetched in a worker thread.
+        """
+        options: Dict[str, Any] = {"max_item_count": page_size}
+        if partition_key is not None:
+            options["partition_key"] = partition_key
+        else:
+            options["enable_cross_partition_query"] = True
+        pages = container.query_items(query=query, parameters=parameters, **options).by_page()
+        while (page := await asyncio.to_thread(_next_page, pages)) is not None:
+            yield page
+
+    async def _partition_key_path(self, container: Any) -> Optional[str]:
+        """Return the container's partition key path, read once per container."""
+        name = container.id
+        if name not in self._partition_paths:
+            try:
+                properties = await asyncio.to_thread(container.read)
+            except Exception as e:
+                # Remember the failure too, so ticker filters don't retry the
+                # metadata read (and warn) on every request
+                logger.warning("Could not read partition key of %s: %s", name, e)
+                self._partition_paths[name] = None
+                return None
+            paths = properties.get("partitionKey", {}).get("paths", [])
+            self._partition_paths[name] = paths[0] if len(paths) == 1 else None
+        return self._partition_paths[name]
+
+    @ttl_cache(ttl=30, ignore=("container",))
+    async def _count_trades(
+        self,
+        where: str,
+        parameters: tuple,
+        container: Any,
+        partition_key: Optional[str] = None
+    ) -> int:
+        """
+        Count broker orders matching a filter, cached for 30 seconds.
+
+        Paging back and forth through the same filter reuses the count instead
+        of issuing a second cross-partition query per page.
+
+        Args:
+            where: WHERE clause of the page query (no ORDER BY/OFFSET)
+            parameters: Query parameters as hashable ``(name, value)`` pairs
+            container: broker-orders container client (not part of the cache key)
+            partition_key: Single partition to count in, if the filter allows it
+        """
+        count_query = f"SELECT VALUE COUNT(1) FROM c WHERE {where}"
+        result = await self._query_items(
+            container,
+            count_query,
+            [{"name": name, "value": value} for name, value in parameters],
+            partition_key=partition_key
         )
+        return result[0] if result else 0
 
+    @ttl_cache(ttl=10, maxsize=1)
     async def get_portfolio_summary(self) -> Dict[str, Any]:
         """
         Get current portfolio summary from Alpaca.
 
+        Cached for 10 seconds and shared by the /portfolio route and the
+        system-health Alpaca probe.
+
         Returns:
             Portfolio summary with positions, cash, and P&L
         """
         if not self.alpaca_available:
-            return {
-                "error": "Alpaca credentials not configured",
-                "total_value": 0,
-                "cash": 0,
-                "positions_value": 0,
-                "buying_power": 0,
-                "positions": []
-            }
+            return {**_EMPTY_PORTFOLIO, "error": "Alpaca credentials not configured"}
 
         try:
             # Import here to avoid circular dependencies
@@ -58,38 +292,33 @@ class DashboardService:
             # Fetch portfolio from Alpaca
             fetcher = AlpacaPortfolioFetcher(paper=True)
 
-            # Get account info and positions for dashboard
-            account = fetcher._client.get_account()
-            positions = fetcher._client.get_all_positions()
+            # Get account info and positions for dashboard; the two REST calls
+            # are independent, so run them concurrently off the event loop
+            account, positions = await asyncio.gather(
+                asyncio.to_thread(fetcher._client.get_account),
+                asyncio.to_thread(fetcher._client.get_all_positions)
+            )
 
             # Calculate totals
             total_value = float(account.portfolio_value)
             cash = float(account.cash)
             buying_power = float(account.buying_power)
 
-            # Calculate positions value
-            positions_value = sum(
-                abs(float(pos.market_value)) for pos in positions
-            )
-
-            # Format positions with P&L
+            # Format positions with P&L and total their value in the same pass
+            positions_value = 0.0
             formatted_positions = []
             for pos in positions:
-                qty = float(pos.qty)
-                current_price = float(pos.current_price)
-                avg_entry = float(pos.avg_entry_price)
                 market_value = float(pos.market_value)
-                unrealized_pl = float(pos.unrealized_pl)
-                unrealized_plpc = float(pos.unrealized_plpc)
+                positions_value += abs(market_value)
 
                 formatted_positions.append({
                     "ticker": pos.symbol,
-                    "quantity": qty,
-                    "avg_cost": avg_entry,
-                    "current_price": current_price,
+                    "quantity": float(pos.qty),
+                    "avg_cost": float(pos.avg_entry_price),
+                    "current_price": float(pos.current_price),
                     "market_value": market_value,
-                    "unrealized_pl": unrealized_pl,
-                    "unrealized_pl_percent": unrealized_plpc * 100,
+                    "unrealized_pl": float(pos.unrealized_pl),
+                    "unrealized_pl_percent": float(pos.unrealized_plpc) * 100,
                     "side": pos.side
                 })
 
@@ -99,19 +328,12 @@ class DashboardService:
                 "positions_value": positions_value,
                 "buying_power": buying_power,
                 "positions": formatted_positions,
-                "last_updated": datetime.utcnow().isoformat()
+                "last_updated": datetime.now(timezone.utc).isoformat()
             }
 
         except Exception as e:
-            logger.error(f"Error fetching Alpaca portfolio: {e}")
-            return {
-                "error": str(e),
-                "total_value": 0,
-                "cash": 0,
-                "positions_value": 0,
-                "buying_power": 0,
-                "positions": []
-            }
+            logger.error("Error fetching Alpaca portfolio: %s", e)
+            return {**_EMPTY_PORTFOLIO, "error": str(e)}
 
     async def get_performance_metrics(self, days: int = 30) -> Dict[str, Any]:
         """
@@ -124,92 +346,62 @@ class DashboardService:
             Performance metrics including win rate, returns, Sharpe ratio
         """
         if not self.cosmos_available:
-            return {
-                "error": "Cosmos DB not configured",
-                "total_trades": 0,
-                "win_rate": 0,
-                "total_return": 0
-            }
+            return {**_EMPTY_METRICS, "error": "Cosmos DB not configured", "total_return": 0}
 
         try:
-            # Import Cosmos repository
-            from src.data.cosmos_repository import CosmosRepository
-
-            repo = CosmosRepository.from_environment()
-
             # Calculate date range
-            end_date = datetime.utcnow()
+            end_date = datetime.now(timezone.utc)
             start_date = end_date - timedelta(days=days)
 
-            # Query broker-orders from Cosmos DB
-            query = """
-                SELECT * FROM c
-                WHERE c.timestamp >= @start_date
-                AND c.timestamp <= @end_date
-                ORDER BY c.timestamp DESC
-            """
+            # Count broker-orders in Cosmos DB; only totals are needed
+            window = "c.timestamp >= @start_date AND c.timestamp <= @end_date"
+            total_query = f"SELECT VALUE COUNT(1) FROM c WHERE {window}"
+            filled_query = f"SELECT VALUE COUNT(1) FROM c WHERE {window} AND c.status = 'filled'"
 
             parameters = [
                 {"name": "@start_date", "value": start_date.isoformat()},
                 {"name": "@end_date", "value": end_date.isoformat()}
             ]
 
-            # Execute query (assuming broker-orders container)
-            container = repo._database.get_container_client("broker-orders")
-            trades = list(container.query_items(
-                query=query,
-                parameters=parameters,
-                enable_cross_partition_query=True
-            ))
+            # Execute queries (assuming broker-orders container) alongside the
+            # equity curve used for return, Sharpe and drawdown
+            container = _cosmos_container("broker-orders")
+            total_count, filled_count, snapshots = await asyncio.gather(
+                self._query_items(container, total_query, parameters),
+                self._query_items(container, filled_query, parameters),
+                self._query_snapshots(start_date, end_date)
+            )
+            total_trades = total_count[0] if total_count else 0
+            cash, positions_value = _snapshot_values(_daily_closes(snapshots))
+            equity_metrics = _equity_metrics(cash + positions_value)
 
             # If no trades, return default metrics
-            if not trades:
-                return {
-                    "period_days": days,
-                    "total_trades": 0,
-                    "win_rate": 0,
-                    "wins": 0,
-                    "losses": 0,
-                    "avg_win": 0,
-                    "avg_loss": 0,
-                    "profit_factor": 0,
-                    "total_return": 0,
-                    "sharpe_ratio": 0,
-                    "max_drawdown": 0
-                }
-
-            # Calculate metrics
-            total_trades = len(trades)
+            if not total_trades:
+                return {"period_days": days, **_NO_TRADE_METRICS, **equity_metrics}
 
             # Separate wins and losses (simplified - would need actual P&L data)
             # For now, we'll estimate based on filled orders
-            wins = [t for t in trades if t.get("status") == "filled"]
-            losses = []
+            wins = filled_count[0] if filled_count else 0
+            losses = 0
 
-            win_rate = (len(wins) / total_trades * 100) if total_trades > 0 else 0
+            win_rate = (wins / total_trades * 100) if total_trades > 0 else 0
 
             return {
                 "period_days": days,
                 "total_trades": total_trades,
                 "win_rate": round(win_rate, 2),
-                "wins": len(wins),
-                "losses": len(losses),
+                "wins": wins,
+                "losses": losses,
                 "avg_win": 0,  # Would need P&L data
                 "avg_loss": 0,  # Would need P&L data
                 "profit_factor": 0,  # Would need P&L data
-                "total_return": 0,  # Would need portfolio history
-                "sharpe_ratio": 0,  # Would need returns history
-                "max_drawdown": 0,  # Would need portfolio history
-                "last_updated": datetime.utcnow().isoformat()
+                **equity_metrics,
+                "last_updated": end_date.isoformat()
             }
 
         except Exception as e:
-            logger.error(f"Error calculating performance metrics: {e}")
-            return {
-                "error": str(e),
-                "total_trades": 0,
-                "win_rate": 0
-            }
+            logger.error("Error calculating performance metrics: %s", e)
+            return {**_EMPTY_METRICS, "error": str(e)}
 
     async def get_trade_history(
         self,
@@ -217,38 +409,38 @@ class DashboardService:
         offset: int = 0,
         ticker: Optional[str] = None,
         action: Optional[str] = None,
-        start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Get trade history with optional filters.
 
+        Pages can be addressed by ``offset`` or, for deep pagination, by
+        ``cursor``: the ``next_cursor`` of the previous page, which encodes
+        the last trade's ``timestamp|id``. Trades are ordered by timestamp and
+        then id, so trades sharing the boundary timestamp are not skipped.
+        Cursor pages seek straight to that position instead of having Cosmos
+        skip ``offset`` documents, and do not run the total COUNT.
+
         Args:
             limit: Maximum number of trades to return
-            offset: Number of trades to skip
+            offset: Number of trades to skip (ignored when cursor is given)
             ticker: Filter by ticker
             action: Filter by action (buy/sell)
             start_date: Filter by start date
             end_date: Filter by end date
+            cursor: Return trades ordered after this ``timestamp|id`` position
 
         Returns:
             Paginated trade history
         """
         if not self.cosmos_available:
-            return {
-                "trades": [],
-                "total": 0,
-                "limit": limit,
-                "offset": offset
-            }
+            return {**_EMPTY_TRADES, "limit": limit, "offset": offset}
 
         try:
-            from src.data.cosmos_repository import CosmosRepository
-
-            repo = CosmosRepository.from_environment()
-
             # Build query
-            query_parts = ["SELECT * FROM c WHERE 1=1"]
+            query_parts = ["1=1"]
             parameters = []
 
             # Add filters
@@ -262,55 +454,73 @@ class DashboardService:
 
             if start_date:
                 query_parts.append("AND c.timestamp >= @start_date")
-                parameters.append({"name": "@start_date", "value": start_date})
+                parameters.append({"name": "@start_date", "value": start_date.isoformat()})
 
             if end_date:
                 query_parts.append("AND c.timestamp <= @end_date")
-                parameters.append({"name": "@end_date", "value": end_date})
-
-            # Add ordering
-            query_parts.append("ORDER BY c.timestamp DESC")
-
-            # Add pagination
-            query_parts.append(f"OFFSET {offset} LIMIT {limit}")
-
-            query = " ".join(query_parts)
+                parameters.append({"name": "@end_date", "value": end_date.isoformat()})
+
+            where = " ".join(query_parts)
+            page_where, page_parameters = where, parameters
+            if cursor:
+                offset = 0
+                cursor_timestamp, _, cursor_id = cursor.partition("|")
+                page_where = (
+                    f"{where} AND (c.timestamp < @cursor_ts"
+                    " OR (c.timestamp = @cursor_ts AND c.id < @cursor_id))"
+                )
+                page_parameters = parameters + [
+                    {"name": "@cursor_ts", "value": cursor_timestamp},
+                    {"name": "@cursor_id", "value": cursor_id},
+                ]
+
+            # Add ordering and pagination; id breaks timestamp ties so the
+            # order (and the cursor position) is total
+            query = (
+                f"SELECT {_TRADE_FIELDS} FROM c WHERE {page_where} "
+                f"ORDER BY c.timestamp DESC, c.id DESC OFFSET {offset} LIMIT {limit}"
+            )
 
-            # Execute query
-            container = repo._database.get_container_client("broker-orders")
-            trades = list(container.query_items(
-                query=query,
-                parameters=parameters,
-                enable_cross_partition_query=True
-            ))
+            # Execute query; a ticker filter pins a single partition when the
+            # container is partitioned on /ticker
+            container = _cosmos_container("broker-orders")
+            partition_key = None
+            if ticker and await self._partition_key_path(container) == "/ticker":
+                partition_key = ticker.upper()
+            trades = await self._query_items(container, query, page_parameters, partition_key, max_item_count=limit)
+            next_cursor = f"{trades[-1].get('timestamp')}|{trades[-1].get('id')}" if trades else None
 
-            # Get total count (without pagination)
-            count_query = " ".join(query_parts[:-1])  # Remove OFFSET/LIMIT
-            count_query = count_query.replace("SELECT *", "SELECT VALUE COUNT(1)")
+            if cursor:
+                return {
+                    "trades": trades,
+                    "total": None,
+                    "limit": limit,
+                    "offset": offset,
+                    "has_more": len(trades) == limit,
+                    "next_cursor": next_cursor
+                }
 
-            total = list(container.query_items(
-                query=count_query,
-                parameters=parameters,
-                enable_cross_partition_query=True
-            ))[0] if trades else 0
+            # Get total count (without pagination); cached per filter so
+            # changing only the offset does not re-run the COUNT
+            total = await self._count_trades(
+                where,
+                tuple((p["name"], p["value"]) for p in parameters),
+                container=container,
+                partition_key=partition_key
+            ) if trades else 0
 
             return {
                 "trades": trades,
                 "total": total,
                 "limit": limit,
                 "offset": offset,
-                "has_more": (offset + len(trades)) < total
+                "has_more": (offset + len(trades)) < total,
+                "next_cursor": next_cursor
             }
 
         except Exception as e:
-            logger.error(f"Error fetching trade history: {e}")
-            return {
-                "error": str(e),
-                "trades": [],
-                "total": 0,
-                "limit": limit,
-                "offset": offset
-            }
+            logger.error("Error fetching trade history: %s", e)
+            return {**_EMPTY_TRADES, "error": str(e), "limit": limit, "offset": offset}
 
     async def get_agent_performance(self, days: int = 30) -> Dict[str, Any]:
         """
@@ -323,23 +533,19 @@ class DashboardService:
             Agent performance rankings
         """
         if not self.cosmos_available:
-            return {
-                "agents": [],
-                "period_days": days
-            }
+            return {**_EMPTY_AGENTS, "period_days": days}
 
         try:
-            from src.data.cosmos_repository import CosmosRepository
-
-            repo = CosmosRepository.from_environment()
-
             # Calculate date range
-            end_date = datetime.utcnow()
+            end_date = datetime.now(timezone.utc)
             start_date = end_date - timedelta(days=days)
 
-            # Query analyst-signals from Cosmos DB
+            # Query analyst-signals from Cosmos DB. Cross-partition GROUP BY is
+            # not supported by the Python SDK, so Cosmos projects and normalizes
+            # just the fields the leaderboard needs and the tally happens here.
             query = """
-                SELECT * FROM c
+                SELECT c.agent_name, c.confidence, LOWER(c.signal) AS signal
+                FROM c
                 WHERE c.timestamp >= @start_date
                 AND c.timestamp <= @end_date
             """
@@ -349,15 +555,9 @@ class DashboardService:
                 {"name": "@end_date", "value": end_date.isoformat()}
             ]
 
-            # Execute query
-            container = repo._database.get_container_client("analyst-signals")
-            signals = list(container.query_items(
-                query=query,
-                parameters=parameters,
-                enable_cross_partition_query=True
-            ))
+            container = _cosmos_container("analyst-signals")
 
-            # Aggregate by agent
+            # Aggregate by agent, one result page at a time
             agent_stats = defaultdict(lambda: {
                 "total_signals": 0,
                 "total_confidence": 0,
@@ -366,20 +566,21 @@ class DashboardService:
                 "hold_signals": 0
             })
 
-            for signal in signals:
-                agent_name = signal.get("agent_name", "Unknown")
-                confidence = signal.get("confidence", 0)
-                action = signal.get("signal", "hold").lower()
+            async for page in self._query_pages(container, query, parameters, self.partition_key):
+                for signal in page:
+                    agent_name = signal.get("agent_name", "Unknown")
+                    confidence = signal.get("confidence", 0)
+                    action = signal.get("signal", "hold")
 
-                agent_stats[agent_name]["total_signals"] += 1
-                agent_stats[agent_name]["total_confidence"] += confidence
+                    agent_stats[agent_name]["total_signals"] += 1
+                    agent_stats[agent_name]["total_confidence"] += confidence
 
-                if action == "buy":
-                    agent_stats[agent_name]["buy_signals"] += 1
-                elif action == "sell":
-                    agent_stats[agent_name]["sell_signals"] += 1
-                else:
-                    agent_stats[agent_name]["hold_signals"] += 1
+                    if action == "buy":
+                        agent_stats[agent_name]["buy_signals"] += 1
+                    elif action == "sell":
+                        agent_stats[agent_name]["sell_signals"] += 1
+                    else:
+                        agent_stats[agent_name]["hold_signals"] += 1
 
             # Format results
             agents = []
@@ -407,112 +608,108 @@ class DashboardService:
                 "agents": agents,
                 "period_days": days,
                 "total_agents": len(agents),
-                "last_updated": datetime.utcnow().isoformat()
+                "last_updated": end_date.isoformat()
             }
 
         except Exception as e:
-            logger.error(f"Error fetching agent performance: {e}")
-            return {
-                "error": str(e),
-                "agents": [],
-                "period_days": days
-            }
+            logger.error("Error fetching agent performance: %s", e)
+            return {**_EMPTY_AGENTS, "error": str(e), "period_days": days}
 
     async def get_system_health(self) -> Dict[str, Any]:
         """
         Get system health metrics.
 
+        The component probes are independent network calls, so they run
+        concurrently and the response time is bounded by the slowest one.
+
         Returns:
             System operational metrics
         """
-        health_data = {
+        alpaca, cosmos_db, queue = await asyncio.gather(
+            self._probe_alpaca(),
+            self._probe_cosmos(),
+            self._probe_queue(),
+            return_exceptions=True
+        )
+
+        components = {}
+        for name, result in (("alpaca", alpaca), ("cosmos_db", cosmos_db), ("queue", queue)):
+            if isinstance(result, Exception):
+                result = {"status": "unhealthy", "error": str(result)}
+            components[name] = result
+
+        return {
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat(),
-            "components": {}
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "components": components
         }
 
-        # Check Alpaca connection
-        if self.alpaca_available:
-            try:
-                portfolio = await self.get_portfolio_summary()
-                health_data["components"]["alpaca"] = {
-                    "status": "healthy" if "error" not in portfolio else "degraded",
-                    "last_updated": portfolio.get("last_updated")
-                }
-            except Exception as e:
-                health_data["components"]["alpaca"] = {
-                    "status": "unhealthy",
-                    "error": str(e)
-                }
-        else:
-            health_data["components"]["alpaca"] = {
-                "status": "not_configured"
-            }
+    async def _probe_alpaca(self) -> Dict[str, Any]:
+        """Check the Alpaca connection."""
+        if not self.alpaca_available:
+            return {"status": "not_configured"}
 
-        # Check Cosmos DB connection
-        if self.cosmos_available:
-            try:
-                from src.data.cosmos_repository import CosmosRepository
-                repo = CosmosRepository.from_environment()
-
-                # Try a simple query
-                container = repo._database.get_container_client("broker-orders")
-                list(container.query_items(
-                    query="SELECT TOP 1 * FROM c",
-                    enable_cross_partition_query=True
-                ))
-
-                health_data["components"]["cosmos_db"] = {
-                    "status": "healthy"
-                }
-            except Exception as e:
-                health_data["components"]["cosmos_db"] = {
-                    "status": "unhealthy",
-                    "error": str(e)
-                }
-        else:
-            health_data["components"]["cosmos_db"] = {
-                "status": "not_configured"
+        try:
+            portfolio = await self.get_portfolio_summary()
+            return {
+                "status": "healthy" if "error" not in portfolio else "degraded",
+                "last_updated": portfolio.get("last_updated")
             }
+        except Exception as e:
+            return {"status": "unhealthy", "error": str(e)}
 
-        # Check queue (if storage account configured)
-        queue_available = bool(
-            os.getenv("QUEUE_ACCOUNT") and
-            os.getenv("QUEUE_NAME")
-        )
+    async def _probe_cosmos(self) -> Dict[str, Any]:
+        """Check the Cosmos DB connection with a trivial query."""
+        if not self.cosmos_available:
+            return {"status": "not_configured"}
 
-        if queue_available:
-            try:
-                from azure.storage.queue import QueueClient
+        try:
+            # Try a simple query
+            container = _cosmos_container("broker-orders")
+            await self._query_items(container, "SELECT TOP 1 VALUE c.id FROM c", max_item_count=1)
 
-                account_name = os.getenv("QUEUE_ACCOUNT")
-                queue_name = os.getenv("QUEUE_NAME", "analysis-requests")
-                sas_token = os.getenv("QUEUE_SAS", "")
+            return {"status": "healthy"}
+        except Exception as e:
+            return {"status": "unhealthy", "error": str(e)}
 
-                queue_url = f"https://{account_name}.queue.core.windows.net/{queue_name}"
-                queue_client = QueueClient.from_queue_url(
-                    queue_url=queue_url,
-                    credential=sas_token
-                )
+    async def _probe_queue(self) -> Dict[str, Any]:
+        """Check the analysis queue (if storage account configured)."""
+        if _QUEUE_URL is None:
+            return {"status": "not_configured"}
 
-                properties = queue_client.get_queue_properties()
-                queue_depth = properties.approximate_message_count
+        try:
+            from azure.storage.queue import QueueClient
 
-                health_data["components"]["queue"] = {
-                    "status": "healthy",
-                    "depth": queue_depth
-                }
-            except Exception as e:
-                health_data["components"]["queue"] = {
-                    "status": "unhealthy",
-                    "error": str(e)
-                }
-        else:
-            health_data["components"]["queue"] = {
-                "status": "not_configured"
+            queue_client = QueueClient.from_queue_url(
+                queue_url=_QUEUE_URL,
+                credential=_QUEUE_SAS
+            )
+
+            properties = await asyncio.to_thread(queue_client.get_queue_properties)
+            return {
+                "status": "healthy",
+                "depth": properties.approximate_message_count
             }
+        except Exception as e:
+            return {"status": "unhealthy", "error": str(e)}
+
+    async def _query_snapshots(self, start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
+        """Fetch the projected portfolio snapshots in a window, oldest first."""
+        query = """
+            SELECT c.timestamp, c.portfolio.cash, c.portfolio.positions
+            FROM c
+            WHERE c.timestamp >= @start_date
+            AND c.timestamp <= @end_date
+            ORDER BY c.timestamp ASC
+        """
+
+        parameters = [
+            {"name": "@start_date", "value": start_date.isoformat()},
+            {"name": "@end_date", "value": end_date.isoformat()}
+        ]
 
-        return health_data
+        container = _cosmos_container("portfolioSnapshots")
+        return await self._query_items(container, query, parameters, self.partition_key)
 
     async def get_portfolio_history(self, days: int = 30) -> Dict[str, Any]:
         """
@@ -525,75 +722,39 @@ class DashboardService:
             Portfolio value time series
         """
         if not self.cosmos_available:
-            return {
-                "history": [],
-                "period_days": days
-            }
+            return {**_EMPTY_HISTORY, "period_days": days}
 
         try:
-            from src.data.cosmos_repository import CosmosRepository
-
-            repo = CosmosRepository.from_environment()
-
             # Calculate date range
-            end_date = datetime.utcnow()
+            end_date = datetime.now(timezone.utc)
             start_date = end_date - timedelta(days=days)
 
-            # Query portfolioSnapshots from Cosmos DB
-            query = """
-                SELECT c.timestamp, c.portfolio
-                FROM c
-                WHERE c.timestamp >= @start_date
-                AND c.timestamp <= @end_date
-                ORDER BY c.timestamp ASC
-            """
-
-            parameters = [
-                {"name": "@start_date", "value": start_date.isoformat()},
-                {"name": "@end_date", "value": end_date.isoformat()}
-            ]
-
-            # Execute query
-            container = repo._database.get_container_client("portfolioSnapshots")
-            snapshots = list(container.query_items(
-                query=query,
-                parameters=parameters,
-                enable_cross_partition_query=True
-            ))
+            snapshots = await self._query_snapshots(start_date, end_date)
+            cash, positions_value = _snapshot_values(snapshots)
 
             # Format history
-            history = []
-            for snapshot in snapshots:
-                portfolio = snapshot.get("portfolio", {})
-                cash = portfolio.get("cash", 0)
-                positions = portfolio.get("positions", {})
-
-                # Calculate total positions value (simplified)
-                positions_value = sum(
-                    pos.get("quantity", 0) * pos.get("current_price", 0)
-                    for pos in positions.values()
-                )
-
-                total_value = cash + positions_value
-
-                history.append({
+            history = [
+                {
                     "date": snapshot.get("timestamp"),
                     "value": total_value,
-                    "cash": cash,
-                    "positions_value": positions_value
-                })
+                    "cash": snapshot_cash,
+                    "positions_value": snapshot_positions_value
+                }
+                for snapshot, total_value, snapshot_cash, snapshot_positions_value in zip(
+                    snapshots,
+                    (cash + positions_value).tolist(),
+                    cash.tolist(),
+                    positions_value.tolist()
+                )
+            ]
 
             return {
                 "history": history,
                 "period_days": days,
                 "data_points": len(history),
-                "last_updated": datetime.utcnow().isoformat()
+                "last_updated": end_date.isoformat()
             }
 
         except Exception as e:
-            logger.error(f"Error fetching portfolio history: {e}")
-            return {
-                "error": str(e),
-                "history": [],
-                "period_days": days
-            }
+            logger.error("Error fetching portfolio history: %s", e)
+            return {**_EMPTY_HISTORY, "error": str(e), "period_days": days}
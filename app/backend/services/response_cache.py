@@ -0,0 +1,68 @@
+"""
+In-process TTL cache for read-heavy API endpoints.
+"""
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def ttl_cache(
+    ttl: float,
+    maxsize: int = 128,
+    ignore: Tuple[str, ...] = (),
+    unless: Optional[Callable[[Dict[str, Any]], bool]] = None,
+):
+    """
+    Cache the results of an async function for ``ttl`` seconds.
+
+    Entries are keyed on the call arguments and evicted least-recently-used
+    once ``maxsize`` is reached, so memory stays bounded. Concurrent misses
+    on the same key share a single upstream call instead of each issuing
+    their own.
+
+    Args:
+        ttl: Seconds a cached result stays fresh
+        maxsize: Maximum number of cached entries
+        ignore: Keyword arguments excluded from the cache key (e.g. injected services)
+        unless: Predicate over the keyword arguments; when it returns True the call bypasses the cache
+    """
+    def decorator(func):
+        entries: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+        in_flight: Dict[tuple, asyncio.Future] = {}
+
+        def settle(key: tuple, future: asyncio.Future) -> None:
+            in_flight.pop(key, None)
+            if future.cancelled() or future.exception() is not None:
+                return
+            entries[key] = (time.monotonic() + ttl, future.result())
+            entries.move_to_end(key)
+            while len(entries) > maxsize:
+                entries.popitem(last=False)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if unless is not None and unless(kwargs):
+                return await func(*args, **kwargs)
+
+            key = args + tuple(sorted((k, v) for k, v in kwargs.items() if k not in ignore))
+            now = time.monotonic()
+
+            entry = entries.get(key)
+            if entry is not None and entry[0] > now:
+                entries.move_to_end(key)
+                return entry[1]
+
+            future = in_flight.get(key)
+            if future is None:
+                future = asyncio.ensure_future(func(*args, **kwargs))
+                in_flight[key] = future
+                future.add_done_callback(functools.partial(settle, key))
+            # Shielded so one caller cancelling does not cancel the shared call
+            return await asyncio.shield(future)
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+
+    return decorator
@@ -72,10 +72,11 @@ export interface Trade {
 
 export interface TradeHistoryResponse {
   trades: Trade[];
-  total: number;
+  total: number | null;
   limit: number;
   offset: number;
   has_more: boolean;
+  next_cursor?: string | null;
   error?: string;
 }
 
@@ -159,6 +160,7 @@ export const dashboardApi = {
     action?: string;
     start_date?: string;
     end_date?: string;
+    cursor?: string;
   }): Promise<TradeHistoryResponse> => {
     const response = await api.get('/dashboard/trades', { params });
     return response.data;
@@ -4,8 +4,14 @@ API client for fetching market data
 import os
 import requests
 import time
+from requests.adapters import HTTPAdapter
 from models import Price, PriceResponse
 
+# Shared across market_monitor's ticker workers (each also fetches the previous
+# close in parallel), so keep enough pooled keep-alive connections for all of them
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+
 
 def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: dict = None, max_retries: int = 3) -> requests.Response:
     """
@@ -26,9 +32,9 @@ def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: d
     """
     for attempt in range(max_retries + 1):  # +1 for initial attempt
         if method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=json_data)
+            response = _SESSION.post(url, headers=headers, json=json_data)
         else:
-            response = requests.get(url, headers=headers)
+            response = _SESSION.get(url, headers=headers)
         
         if response.status_code == 429 and attempt < max_retries:
             # Linear backoff: 60s, 90s, 120s, 150s...
@@ -67,6 +73,6 @@ def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None,
     if response.status_code != 200:
         raise Exception(f"Error fetching data: {ticker} - {response.status_code} - {response.text}")
 
-    # Parse response with Pydantic model
-    price_response = PriceResponse(**response.json())
+    # Parse response with Pydantic model, straight from the raw bytes
+    price_response = PriceResponse.model_validate_json(response.content)
     return price_response.prices
@@ -11,12 +11,14 @@ Features:
 - VWAP, ATR, gap detection, volume velocity, and more
 """
 import datetime as dt
-import json
 import logging
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from statistics import mean
+from functools import lru_cache, partial
 from typing import Iterable, Sequence, Optional
 from zoneinfo import ZoneInfo
 
@@ -73,6 +75,8 @@ except Exception as e:
     logger.warning(f"SSL configuration error: {e}")
 
 import azure.functions as func
+import numpy as np
+import orjson
 from azure.cosmos import CosmosClient, PartitionKey, exceptions as cosmos_exceptions
 from azure.storage.queue import QueueClient
 
@@ -80,12 +84,32 @@ from azure.storage.queue import QueueClient
 from models import Price
 from api_client import get_prices
 from multi_api_client import MultiAPIClient, Quote, IntradayBar
-from signal_detection import enhanced_signal_detection, SignalResult
+from signal_detection import SignalResult, calculate_rsi, enhanced_signal_detection
 from market_calendar import is_market_open, is_market_holiday, previous_trading_day
 
 
 EASTERN = ZoneInfo("America/New_York")
 
+# Upper bound on concurrent per-ticker workers in market_monitor
+_MAX_TICKER_WORKERS = 16
+
+# Non-ISO timestamp layouts some price feeds return
+_PRICE_TIME_FORMATS = ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S")
+
+# Recently fetched price histories, keyed on the request: (expires_at, prices)
+_BAR_CACHE: dict[tuple, tuple[float, list[Price]]] = {}
+_BAR_CACHE_LOCK = threading.Lock()
+
+# Ranges ending before today no longer change, so they can be kept much longer
+_SETTLED_BAR_CACHE_TTL_SEC = 6 * 60 * 60
+
+# How long a "no trigger within the cooldown" answer is reused. Shorter than
+# the 1-minute fast_monitor schedule, so every tick re-reads it from Cosmos
+_TRIGGER_MISS_CACHE_TTL = dt.timedelta(seconds=30)
+
+# Queue messages may carry NumPy scalars from indicator math; encode them natively
+_QUEUE_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
 # Initialize the Azure Functions app
 app = func.FunctionApp()
 
@@ -108,36 +132,115 @@ class SignalSummary:
 class CosmosCooldownStore:
     """Persist ticker trigger timestamps in Cosmos DB."""
 
-    def __init__(self, endpoint: str, key: str, database: str, container: str) -> None:
+    def __init__(self, endpoint: str, key: str, database: str, container: str, cache_ttl_seconds: float = 1800) -> None:
         self._client = CosmosClient(url=endpoint, credential=key)
         self._database = self._client.create_database_if_not_exists(id=database)
         self._container = self._database.create_container_if_not_exists(
             id=container,
             partition_key=PartitionKey(path="/ticker")
         )
+        # ticker -> (last trigger, valid until). Another host may record a
+        # newer trigger at any time, so only answers that cannot go stale are
+        # kept: a trigger still inside the cooldown window (a newer one only
+        # extends it). "No recent trigger" is kept just long enough to serve
+        # the current tick after the get_last_triggers batch read.
+        self._cache_ttl = dt.timedelta(seconds=cache_ttl_seconds)
+        self._trigger_cache: dict[str, tuple[dt.datetime | None, dt.datetime]] = {}
+
+    def _cache_trigger(self, ticker: str, last_trigger: dt.datetime | None, now: dt.datetime) -> None:
+        if last_trigger is not None and now - last_trigger < self._cache_ttl:
+            self._trigger_cache[ticker] = (last_trigger, last_trigger + self._cache_ttl)
+        else:
+            self._trigger_cache[ticker] = (last_trigger, now + _TRIGGER_MISS_CACHE_TTL)
+
+    def _cached_trigger(self, ticker: str, now: dt.datetime) -> tuple[bool, dt.datetime | None]:
+        cached = self._trigger_cache.get(ticker)
+        if cached is not None and now < cached[1]:
+            return True, cached[0]
+        return False, None
 
     def get_last_trigger(self, ticker: str) -> dt.datetime | None:
+        now = dt.datetime.now(dt.timezone.utc)
+        hit, last_trigger = self._cached_trigger(ticker, now)
+        if hit:
+            return last_trigger
+
         try:
             item = self._container.read_item(item=ticker, partition_key=ticker)
         except cosmos_exceptions.CosmosResourceNotFoundError:
-            return None
+            item = {}
         except cosmos_exceptions.CosmosHttpResponseError as exc:
-            logging.error("Cosmos read failed for %s: %s", ticker, exc)
+            logger.error("Cosmos read failed for %s: %s", ticker, exc)
             return None
 
-        timestamp = item.get("last_triggered_utc")
+        last_trigger = self._parse_trigger(ticker, item.get("last_triggered_utc"))
+        self._cache_trigger(ticker, last_trigger, now)
+        return last_trigger
+
+    def get_last_triggers(self, tickers: Sequence[str]) -> dict[str, dt.datetime | None]:
+        """
+        Look up several tickers at once.
+
+        Tickers still cooling down are served from memory; the rest are
+        fetched with one cross-partition query instead of a point read per
+        ticker, and cached for this tick's get_last_trigger calls.
+        """
+        now = dt.datetime.now(dt.timezone.utc)
+        triggers: dict[str, dt.datetime | None] = {}
+        missing: list[str] = []
+        for ticker in tickers:
+            hit, last_trigger = self._cached_trigger(ticker, now)
+            if hit:
+                triggers[ticker] = last_trigger
+            else:
+                missing.append(ticker)
+        if not missing:
+            return triggers
+
+        try:
+            items = self._container.query_items(
+                query="SELECT c.id, c.last_triggered_utc FROM c WHERE ARRAY_CONTAINS(@tickers, c.id)",
+                parameters=[{"name": "@tickers", "value": missing}],
+                enable_cross_partition_query=True,
+            )
+            stored = {item["id"]: item.get("last_triggered_utc") for item in items}
+        except cosmos_exceptions.CosmosHttpResponseError as exc:
+            # Leave the misses uncached; get_last_trigger falls back to point reads
+            logger.error("Cosmos batch read failed for %d tickers: %s", len(missing), exc)
+            return triggers
+
+        for ticker in missing:
+            last_trigger = self._parse_trigger(ticker, stored.get(ticker))
+            self._cache_trigger(ticker, last_trigger, now)
+            triggers[ticker] = last_trigger
+        return triggers
+
+    @staticmethod
+    def _parse_trigger(ticker: str, timestamp: str | None) -> dt.datetime | None:
         if not timestamp:
             return None
         try:
             parsed = dt.datetime.fromisoformat(timestamp)
         except ValueError:
-            logging.warning("Invalid timestamp stored for %s: %s", ticker, timestamp)
+            logger.warning("Invalid timestamp stored for %s: %s", ticker, timestamp)
             return None
         if parsed.tzinfo is None:
             parsed = parsed.replace(tzinfo=dt.timezone.utc)
         return parsed.astimezone(dt.timezone.utc)
 
-    def upsert_trigger(self, ticker: str, triggered_at: dt.datetime, reasons: list[str]) -> None:
+    def upsert_trigger(
+        self,
+        ticker: str,
+        triggered_at: dt.datetime,
+        reasons: list[str],
+        related: Sequence[dict] = (),
+    ) -> None:
+        """
+        Record a trigger for ``ticker``.
+
+        ``related`` documents share the ticker partition and are written in the
+        same transactional batch, so the whole update is a single round-trip.
+        """
         payload = {
             "id": ticker,
             "ticker": ticker,
@@ -145,41 +248,104 @@ class CosmosCooldownStore:
             "last_reasons": reasons,
         }
         try:
-            self._container.upsert_item(payload)
-        except cosmos_exceptions.CosmosHttpResponseError as exc:
-            logging.error("Failed to persist trigger for %s: %s", ticker, exc)
+            if related:
+                self._container.execute_item_batch(
+                    [("upsert", (item,)) for item in (*related, payload)],
+                    partition_key=ticker,
+                )
+            else:
+                self._container.upsert_item(payload)
+        except (cosmos_exceptions.CosmosHttpResponseError, cosmos_exceptions.CosmosBatchOperationError) as exc:
+            logger.error("Failed to persist trigger for %s: %s", ticker, exc)
+            return
+        self._cache_trigger(ticker, triggered_at, dt.datetime.now(dt.timezone.utc))
 
 
 def _parse_watchlist(raw: str | None) -> list[str]:
     if not raw:
         return []
-    return [token.strip().upper() for token in raw.split(",") if token.strip()]
+    # Drop repeats (keeping order) so no ticker is processed twice in one tick
+    return list(dict.fromkeys(token.strip().upper() for token in raw.split(",") if token.strip()))
 
 
 def _parse_price_time(value: str) -> dt.datetime:
-    sanitized = value.replace("Z", "+00:00")
+    parsed = _parse_known_time(value)
+    if parsed is None:
+        # Not cached: the fallback depends on the current time
+        logger.warning("Unable to parse price timestamp: %s", value)
+        parsed = dt.datetime.now(dt.timezone.utc)
+    return parsed
+
+
+# Bar timestamps repeat across tickers and across ticks, since each fetch
+# re-reads an overlapping history window; sized to hold a few windows
+@lru_cache(maxsize=16384)
+def _parse_known_time(value: str) -> dt.datetime | None:
+    # Python 3.11's fromisoformat accepts "Z" and space-separated times, so it
+    # covers every layout the feeds send; strptime only sees malformed input
     try:
-        parsed = dt.datetime.fromisoformat(sanitized)
+        parsed = dt.datetime.fromisoformat(value)
     except ValueError:
-        for fmt in ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"):
+        for fmt in _PRICE_TIME_FORMATS:
             try:
                 parsed = dt.datetime.strptime(value, fmt)
                 break
             except ValueError:
                 continue
         else:
-            logging.warning("Unable to parse price timestamp: %s", value)
-            parsed = dt.datetime.utcnow()
+            return None
         parsed = parsed.replace(tzinfo=dt.timezone.utc)
     if parsed.tzinfo is None:
         parsed = parsed.replace(tzinfo=dt.timezone.utc)
     return parsed.astimezone(dt.timezone.utc)
 
 
+def _sorts_lexically(values: Sequence[str]) -> bool:
+    """
+    True when timestamps are in order by plain string comparison alone.
+
+    Only trusted when every value shares the first one's length and
+    everything after the seconds field (fraction and zone), so the strings
+    differ only in their date/time digits and lexical order is chronological.
+    """
+    if not values:
+        return True
+    length, suffix = len(values[0]), values[0][19:]
+    if any(len(value) != length or value[19:] != suffix for value in values):
+        return False
+    return all(earlier <= later for earlier, later in zip(values, values[1:]))
+
+
 def _isoformat(timestamp: dt.datetime) -> str:
     return timestamp.replace(microsecond=0).isoformat()
 
 
+def _load_fast_candidates(store: CosmosCooldownStore, tickers: Sequence[str], since: dt.datetime) -> dict[str, dict]:
+    """
+    Fetch pending fast_monitor candidates for all tickers in one query.
+
+    Returns the most recently detected candidate per ticker. Query failures
+    are logged and yield no candidates, so detection proceeds unconfirmed.
+    """
+    placeholders = ", ".join(f"@t{i}" for i in range(len(tickers)))
+    query = (
+        "SELECT * FROM c WHERE c.type = 'fast_candidate' AND c.status = 'pending_confirmation' "
+        f"AND c.detected_at >= @since AND c.ticker IN ({placeholders})"
+    )
+    parameters = [{"name": "@since", "value": _isoformat(since)}]
+    parameters += [{"name": f"@t{i}", "value": ticker} for i, ticker in enumerate(tickers)]
+
+    candidates: dict[str, dict] = {}
+    try:
+        items = store._container.query_items(query=query, parameters=parameters, enable_cross_partition_query=True)
+        # detected_at is a fixed-format UTC ISO string, so it sorts chronologically
+        for item in sorted(items, key=lambda doc: doc.get("detected_at", "")):
+            candidates[item["ticker"]] = item
+    except Exception as exc:
+        logger.error("Error querying fast candidates: %s", exc)
+    return candidates
+
+
 def _load_queue_client() -> QueueClient:
     connection = (
         os.getenv("MARKET_MONITOR_QUEUE_CONNECTION_STRING")
@@ -194,14 +360,29 @@ def _load_queue_client() -> QueueClient:
     )
     if not connection or not queue_name:
         raise RuntimeError("Queue storage configuration is missing")
+    # Queues are provisioned at deploy time; creating at runtime is opt-in (e.g. Azurite)
+    auto_create = os.getenv("AUTO_CREATE_QUEUE", "0").strip().lower() in ("1", "true", "yes")
+    return _queue_client(connection, queue_name, auto_create)
+
+
+@lru_cache(maxsize=4)
+def _queue_client(connection: str, queue_name: str, auto_create: bool = False) -> QueueClient:
+    # Built once per worker process; QueueClient is safe to share across threads
     client = QueueClient.from_connection_string(connection, queue_name)
-    try:
-        client.create_queue()
-    except Exception:  # Queue may already exist
-        pass
+    if auto_create:
+        try:
+            client.create_queue()
+        except Exception:  # Queue may already exist
+            pass
     return client
 
 
+@lru_cache(maxsize=1)
+def _cosmos_store(endpoint: str, key: str, database: str, container: str, cache_ttl_seconds: float) -> CosmosCooldownStore:
+    # One store per worker process, so its trigger cache outlives a single timer tick
+    return CosmosCooldownStore(endpoint, key, database, container, cache_ttl_seconds=cache_ttl_seconds)
+
+
 def _ensure_cosmos_store() -> CosmosCooldownStore:
     endpoint = os.getenv("COSMOS_ENDPOINT")
     key = os.getenv("COSMOS_KEY")
@@ -209,7 +390,17 @@ def _ensure_cosmos_store() -> CosmosCooldownStore:
     container = os.getenv("COSMOS_CONTAINER")
     if not all([endpoint, key, database, container]):
         raise RuntimeError("Cosmos DB configuration is missing required settings")
-    return CosmosCooldownStore(endpoint, key, database, container)
+    cache_ttl_seconds = float(
+        os.getenv("COSMOS_COOLDOWN_CACHE_TTL_SEC")
+        or os.getenv("MARKET_MONITOR_COOLDOWN_SECONDS", str(30 * 60))
+    )
+    return _cosmos_store(endpoint, key, database, container, cache_ttl_seconds)
+
+
+@lru_cache(maxsize=1)
+def _get_multi_client() -> MultiAPIClient:
+    # Warm Function workers are reused across timer fires, so keep one client per process
+    return MultiAPIClient()
 
 
 def _is_market_hours(now_utc: dt.datetime) -> bool:
@@ -224,10 +415,115 @@ def _history_window_days(volume_window: int) -> int:
     return max(default_days, volume_window + 2)
 
 
+@dataclass(frozen=True)
+class MonitorConfig:
+    """Timer settings parsed from app settings; see ENV_VARIABLES.md."""
+    watchlist: tuple[str, ...]
+    percent_threshold: float
+    volume_multiplier: float
+    volume_window: int
+    history_days: int
+    analysis_window_minutes: int
+    cooldown_seconds: int
+    interval: str
+    interval_multiplier: int
+    fast_percent_threshold: float
+    fast_cooldown_seconds: int
+    bar_cache_ttl_seconds: float
+    vwap_std_threshold: float
+    velocity_threshold: float
+    min_confidence: float
+    analysis_lookback_days: int
+    user_id: str
+    strategy_id: str
+    validation_exit_threshold: int
+
+
+@lru_cache(maxsize=1)
+def _load_monitor_config() -> MonitorConfig:
+    # Parsed once per worker process: changing app settings restarts the
+    # Functions host, so a cached copy cannot go stale
+    watchlist_env = (
+        os.getenv("MARKET_MONITOR_WATCHLIST")
+        or os.getenv("WATCHLIST_TICKERS")
+        or os.getenv("DEFAULT_WATCHLIST")
+    )
+    watchlist = _parse_watchlist(watchlist_env)
+    if not watchlist:
+        watchlist = ["AAPL", "MSFT", "NVDA"]
+        logger.warning("No watchlist configured; falling back to default %s", watchlist)
+
+    volume_window = int(os.getenv("MARKET_MONITOR_VOLUME_LOOKBACK", "10"))
+    return MonitorConfig(
+        watchlist=tuple(watchlist),
+        percent_threshold=float(os.getenv("MARKET_MONITOR_PERCENT_CHANGE_THRESHOLD", "0.02")),
+        volume_multiplier=float(os.getenv("MARKET_MONITOR_VOLUME_SPIKE_MULTIPLIER", "1.5")),
+        volume_window=volume_window,
+        history_days=_history_window_days(volume_window),
+        analysis_window_minutes=int(os.getenv("MARKET_MONITOR_ANALYSIS_WINDOW_MINUTES", "120")),
+        cooldown_seconds=int(os.getenv("MARKET_MONITOR_COOLDOWN_SECONDS", str(30 * 60))),
+        # Get interval settings for intraday monitoring
+        interval=os.getenv("MARKET_MONITOR_INTERVAL", "minute"),
+        interval_multiplier=int(os.getenv("MARKET_MONITOR_INTERVAL_MULTIPLIER", "5")),
+        # Fast detection thresholds (more aggressive)
+        fast_percent_threshold=float(os.getenv("FAST_MONITOR_PERCENT_THRESHOLD", "0.005")),  # 0.5%
+        fast_cooldown_seconds=int(os.getenv("FAST_MONITOR_COOLDOWN_SECONDS", str(5 * 60))),  # 5 minutes
+        # 0 disables the in-process price history cache
+        bar_cache_ttl_seconds=float(os.getenv("MARKET_MONITOR_BAR_CACHE_TTL_SEC", "45")),
+        vwap_std_threshold=float(os.getenv("MARKET_MONITOR_VWAP_STD_THRESHOLD", "2.0")),
+        velocity_threshold=float(os.getenv("MARKET_MONITOR_VELOCITY_THRESHOLD", "0.001")),
+        min_confidence=float(os.getenv("MARKET_MONITOR_MIN_CONFIDENCE", "0.70")),
+        # Technical analysis requires at least 126 trading days (6 months) for momentum indicators
+        # 180 calendar days ≈ 130 trading days, providing sufficient buffer
+        analysis_lookback_days=int(os.getenv("MARKET_MONITOR_ANALYSIS_LOOKBACK_DAYS", "180")),
+        user_id=os.getenv("MARKET_MONITOR_USER_ID", "market-monitor"),
+        strategy_id=os.getenv("MARKET_MONITOR_STRATEGY_ID", "auto-signal"),
+        validation_exit_threshold=int(os.getenv("VALIDATION_EXIT_THRESHOLD", "30")),
+    )
+
+
 def _fetch_price_history(ticker: str, start_date: str, end_date: str, interval: str = "day", interval_multiplier: int = 1) -> list[Price]:
     """Fetch price history with configurable intervals"""
     prices = get_prices(ticker=ticker, start_date=start_date, end_date=end_date, interval=interval, interval_multiplier=interval_multiplier)
-    prices = sorted(prices, key=lambda price: _parse_price_time(price.time))
+    # The API normally returns bars already in order; confirm that on the raw
+    # strings before paying for any parsing
+    if _sorts_lexically([price.time for price in prices]):
+        return prices
+    # Otherwise parse each timestamp once
+    times = [_parse_price_time(price.time) for price in prices]
+    if all(earlier <= later for earlier, later in zip(times, times[1:])):
+        return prices
+    order = sorted(range(len(prices)), key=times.__getitem__)
+    return [prices[i] for i in order]
+
+
+def _cached_fetch_price_history(ticker: str, start_date: str, end_date: str, interval: str = "day", interval_multiplier: int = 1) -> list[Price]:
+    """
+    _fetch_price_history behind a short-lived in-process cache.
+
+    Overlapping or retried executions within the TTL reuse the same bars, and
+    ranges that ended before today (e.g. the previous-day close) are reused
+    across ticks. The returned list is shared, so callers must not mutate it.
+    """
+    ttl = _load_monitor_config().bar_cache_ttl_seconds
+    if ttl <= 0:
+        return _fetch_price_history(ticker, start_date, end_date, interval=interval, interval_multiplier=interval_multiplier)
+
+    key = (ticker, start_date, end_date, interval, interval_multiplier)
+    now = time.monotonic()
+    entry = _BAR_CACHE.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    prices = _fetch_price_history(ticker, start_date, end_date, interval=interval, interval_multiplier=interval_multiplier)
+    # An empty settled range usually means the provider has not published it
+    # yet (e.g. the previous-day bar early in the session), so retry it soon
+    if prices and end_date < dt.datetime.now(EASTERN).date().isoformat():
+        ttl = max(ttl, _SETTLED_BAR_CACHE_TTL_SEC)
+    with _BAR_CACHE_LOCK:
+        for stale in [k for k, (expires_at, _) in _BAR_CACHE.items() if expires_at <= now]:
+            del _BAR_CACHE[stale]
+        _BAR_CACHE[key] = (now + ttl, prices)
     return prices
 
 
@@ -239,23 +535,24 @@ def _evaluate_signals(
     volume_window: int,
 ) -> SignalSummary | None:
     if len(prices) < 2:
-        logging.info("Not enough price history for %s to compute signals", ticker)
+        logger.info("Not enough price history for %s to compute signals", ticker)
         return None
 
-    sorted_prices = list(prices)
-    latest = sorted_prices[-1]
-    previous = sorted_prices[-2]
+    # prices is already in chronological order; index it directly
+    latest = prices[-1]
+    previous = prices[-2]
     if previous.close == 0:
-        logging.warning("Previous close is zero for %s; skipping", ticker)
+        logger.warning("Previous close is zero for %s; skipping", ticker)
         return None
 
     percent_change = (latest.close - previous.close) / previous.close
 
-    historical_window = sorted_prices[max(0, len(sorted_prices) - volume_window - 1) : -1]
+    historical_window = prices[max(0, len(prices) - volume_window - 1) : -1]
     average_volume = None
     volume_ratio = None
     if historical_window:
-        average_volume = mean(price.volume for price in historical_window)
+        volumes = np.fromiter((price.volume for price in historical_window), dtype=np.float64, count=len(historical_window))
+        average_volume = float(volumes.mean())
         if average_volume > 0:
             volume_ratio = latest.volume / average_volume
 
@@ -285,16 +582,21 @@ def _compose_queue_payload(
     watchlist: Iterable[str],
     detection_method: str = "enhanced",
     prices: list[Price] = None,
+    today_eastern: dt.date | None = None,
+    related_watchlist: list[str] | None = None,
+    config: MonitorConfig | None = None,
 ) -> dict:
+    if config is None:
+        config = _load_monitor_config()
     # Calculate proper date range for analysis (not timestamps)
-    # Technical analysis requires at least 126 trading days (6 months) for momentum indicators
-    # 180 calendar days ≈ 130 trading days, providing sufficient buffer
-    lookback_days = int(os.getenv("MARKET_MONITOR_ANALYSIS_LOOKBACK_DAYS", "180"))
+    lookback_days = config.analysis_lookback_days
 
-    # End date is today, start date is lookback_days ago
-    eastern_now = triggered_at.astimezone(EASTERN)
-    end_date = eastern_now.date().isoformat()
-    start_date = (eastern_now.date() - dt.timedelta(days=lookback_days)).isoformat()
+    # End date is today, start date is lookback_days ago; callers that already
+    # know today's Eastern date pass it to skip the timezone conversion
+    if today_eastern is None:
+        today_eastern = triggered_at.astimezone(EASTERN).date()
+    end_date = today_eastern.isoformat()
+    start_date = (today_eastern - dt.timedelta(days=lookback_days)).isoformat()
 
     # Extract price data for snapshot (if available)
     latest_close = prices[-1].close if prices and len(prices) > 0 else 0.0
@@ -313,8 +615,8 @@ def _compose_queue_payload(
         },
 
         # User and strategy identification
-        "user_id": os.getenv("MARKET_MONITOR_USER_ID", "market-monitor"),
-        "strategy_id": os.getenv("MARKET_MONITOR_STRATEGY_ID", "auto-signal"),
+        "user_id": config.user_id,
+        "strategy_id": config.strategy_id,
 
         # Enhanced signal detection metadata (Fix #4)
         "confidence": signal_result.confidence,
@@ -331,7 +633,10 @@ def _compose_queue_payload(
         "signals": signal_result.reasons,
         "triggered_at": _isoformat(triggered_at),
         "correlation_hints": {
-            "related_watchlist": [symbol for symbol in watchlist if symbol != ticker],
+            "related_watchlist": (
+                related_watchlist if related_watchlist is not None
+                else [symbol for symbol in watchlist if symbol != ticker]
+            ),
             "basis": signal_result.reasons,
         },
     }
@@ -360,187 +665,319 @@ def _format_schedule_status(timer: func.TimerRequest | None) -> str:
     return "unknown"
 
 
+@dataclass
+class MonitorContext:
+    """Per-tick settings and clients shared by the market_monitor workers."""
+    now_utc: dt.datetime
+    today_eastern: dt.date
+    start_date: str
+    end_date: str
+    interval: str
+    interval_multiplier: int
+    percent_threshold: float
+    volume_multiplier: float
+    cooldown_window: dt.timedelta
+    analysis_window_minutes: int
+    watchlist: list[str]
+    watchlist_positions: dict[str, int]
+    queue_client: QueueClient
+    cooldown_store: CosmosCooldownStore
+    fast_candidates: dict[str, dict]
+    config: MonitorConfig
+
+
+def _save_candidate(store: CosmosCooldownStore, ticker: str, candidate: dict) -> None:
+    try:
+        store._container.upsert_item(candidate)
+    except Exception as exc:
+        logger.error("Failed to update fast candidate status for %s: %s", ticker, exc)
+
+
+def _process_ticker(ticker: str, ctx: MonitorContext) -> tuple[dict, list[str]] | None:
+    """
+    Run detection for one ticker and enqueue an analysis request if it fires.
+
+    Returns the enqueued payload and its trigger reasons, or None when nothing
+    was sent. Runs on a worker thread; the queue client and cooldown store are
+    shared across workers.
+    """
+    logger.debug("Processing ticker: %s", ticker)
+
+    # Fix #3: Check for fast_monitor candidates
+    detection_method = "enhanced"
+    fast_candidate = ctx.fast_candidates.get(ticker)
+    if fast_candidate:
+        logger.info("Found fast candidate for %s (detected at %s, confidence: %.2f)",
+                   ticker, fast_candidate.get("detected_at"), fast_candidate.get("confidence", 0))
+        detection_method = "fast_confirm"
+
+    try:
+        # Fetch intraday prices (5-minute bars by default)
+        prices = _cached_fetch_price_history(ticker, ctx.start_date, ctx.end_date, interval=ctx.interval, interval_multiplier=ctx.interval_multiplier)
+        logger.debug("Fetched %d price records for %s (%s/%d interval)", len(prices), ticker, ctx.interval, ctx.interval_multiplier)
+
+        # Previous day close for gap detection; a settled range, so after the
+        # first tick this is an in-memory hit
+        prev_day = previous_trading_day(ctx.today_eastern).isoformat()
+        prev_day_prices = _cached_fetch_price_history(ticker, prev_day, prev_day, interval="day", interval_multiplier=1)
+        previous_close = prev_day_prices[-1].close if prev_day_prices else None
+
+    except Exception as exc:  # noqa: BLE001 - log and continue on data failure
+        logger.exception("Failed to fetch prices for %s: %s", ticker, exc)
+        return None
+
+    # Use enhanced signal detection with 9+ indicators
+    signal_result = enhanced_signal_detection(
+        ticker=ticker,
+        prices=prices,
+        previous_day_close=previous_close,
+        percent_threshold=ctx.percent_threshold,
+        volume_multiplier=ctx.volume_multiplier,
+        vwap_std_threshold=ctx.config.vwap_std_threshold,
+        velocity_threshold=ctx.config.velocity_threshold,
+    )
+
+    # Fix #3: Combine fast candidate confidence with enhanced detection
+    combined_confidence = signal_result.confidence
+    if fast_candidate:
+        fast_conf = fast_candidate.get("confidence", 0)
+        # Weighted combination: 40% fast, 60% enhanced
+        combined_confidence = (fast_conf * 0.4) + (signal_result.confidence * 0.6)
+        signal_result.confidence = round(combined_confidence, 2)
+
+        # Update priority if combined confidence is higher
+        if combined_confidence > 0.85:
+            signal_result.priority = "critical"
+        elif combined_confidence > 0.75:
+            signal_result.priority = "high"
+
+        logger.info("%s: Combined fast + enhanced confidence: %.2f (fast: %.2f, enhanced: %.2f)",
+                    ticker, combined_confidence, fast_conf, signal_result.confidence)
+
+        # Mark candidate as confirmed; it is written once below with its final status
+        fast_candidate["status"] = "confirmed"
+        fast_candidate["confirmed_at"] = _isoformat(ctx.now_utc)
+        fast_candidate["final_confidence"] = combined_confidence
+
+    # Decision: send to queue if confidence meets threshold
+    min_confidence = ctx.config.min_confidence
+
+    if not signal_result.triggered:
+        logger.debug("%s: No signals triggered (confidence: %.2f, metrics: %s)",
+                     ticker, signal_result.confidence, signal_result.metrics)
+
+        # Mark fast candidate as rejected if exists
+        if fast_candidate:
+            fast_candidate["status"] = "rejected_no_confirmation"
+            _save_candidate(ctx.cooldown_store, ticker, fast_candidate)
+        return None
+
+    # Check if confidence meets threshold
+    if signal_result.confidence < min_confidence:
+        logger.info("%s: Signals triggered but confidence too low (%.2f < %.2f)",
+                    ticker, signal_result.confidence, min_confidence)
+
+        # Mark fast candidate as rejected if exists
+        if fast_candidate:
+            fast_candidate["status"] = "rejected_low_confidence"
+            _save_candidate(ctx.cooldown_store, ticker, fast_candidate)
+        return None
+
+    logger.info("%s: SIGNALS DETECTED - %s (confidence: %.2f, priority: %s)",
+                ticker, signal_result.reasons, signal_result.confidence, signal_result.priority)
+    logger.debug("%s: Signal metrics: %s", ticker, signal_result.metrics)
+
+    last_trigger = ctx.cooldown_store.get_last_trigger(ticker)
+    if last_trigger and ctx.now_utc - last_trigger < ctx.cooldown_window:
+        logger.info("Ticker %s skipped due to cooldown (last trigger at %s)", ticker, last_trigger)
+        if fast_candidate:
+            _save_candidate(ctx.cooldown_store, ticker, fast_candidate)
+        return None
+
+    # The watchlist is de-duplicated, so slicing around the ticker's position
+    # yields the other symbols without comparing every entry
+    position = ctx.watchlist_positions[ticker]
+    related_watchlist = ctx.watchlist[:position] + ctx.watchlist[position + 1:]
+    payload = _compose_queue_payload(
+        ticker, ctx.now_utc, ctx.analysis_window_minutes, signal_result, ctx.watchlist,
+        detection_method=detection_method, prices=prices, today_eastern=ctx.today_eastern,
+        related_watchlist=related_watchlist, config=ctx.config,
+    )
+    try:
+        ctx.queue_client.send_message(orjson.dumps(payload, option=_QUEUE_JSON_OPTIONS).decode())
+        logger.info("✓ Enqueued analysis request for %s - reasons: %s, confidence: %.2f, priority: %s",
+                    ticker, signal_result.reasons, signal_result.confidence, signal_result.priority)
+        # The confirmed candidate shares the ticker partition, so it rides in the trigger batch
+        ctx.cooldown_store.upsert_trigger(
+            ticker, ctx.now_utc, signal_result.reasons,
+            related=(fast_candidate,) if fast_candidate else (),
+        )
+    except Exception as exc:  # noqa: BLE001 - surface queue issues
+        logger.exception("Failed to enqueue analysis for %s: %s", ticker, exc)
+        if fast_candidate:
+            _save_candidate(ctx.cooldown_store, ticker, fast_candidate)
+        return None
+
+    return payload, signal_result.reasons
+
+
 @app.timer_trigger(schedule="0 */5 * * * *", arg_name="market_timer", run_on_startup=False, use_monitor=False)
 def market_monitor(market_timer: func.TimerRequest) -> None:
     """
     Market monitoring timer function.
     Runs every 5 minutes during market hours to detect price breakouts and volume spikes.
     """
-    logging.info("Market monitor timer triggered at %s", _format_schedule_status(market_timer))
+    logger.info("Market monitor timer triggered at %s", _format_schedule_status(market_timer))
 
     now_utc = dt.datetime.now(dt.timezone.utc)
     eastern_now = now_utc.astimezone(EASTERN)
-    logging.info("Current time - UTC: %s, ET: %s, Day of week: %d", now_utc, eastern_now, eastern_now.weekday())
+    logger.info("Current time - UTC: %s, ET: %s, Day of week: %d", now_utc, eastern_now, eastern_now.weekday())
     
     if not _is_market_hours(now_utc):
-        logging.info("Outside market hours - skipping execution")
+        logger.info("Outside market hours - skipping execution")
         return
     
-    logging.info("Within market hours - proceeding with monitoring")
+    logger.info("Within market hours - proceeding with monitoring")
 
-    watchlist_env = (
-        os.getenv("MARKET_MONITOR_WATCHLIST")
-        or os.getenv("WATCHLIST_TICKERS")
-        or os.getenv("DEFAULT_WATCHLIST")
-    )
-    watchlist = _parse_watchlist(watchlist_env)
-    if not watchlist:
-        watchlist = ["AAPL", "MSFT", "NVDA"]
-        logging.warning("No watchlist configured; falling back to default %s", watchlist)
-
-    percent_threshold = float(os.getenv("MARKET_MONITOR_PERCENT_CHANGE_THRESHOLD", "0.02"))
-    volume_multiplier = float(os.getenv("MARKET_MONITOR_VOLUME_SPIKE_MULTIPLIER", "1.5"))
-    volume_window = int(os.getenv("MARKET_MONITOR_VOLUME_LOOKBACK", "10"))
-    analysis_window_minutes = int(os.getenv("MARKET_MONITOR_ANALYSIS_WINDOW_MINUTES", "120"))
-    cooldown_seconds = int(os.getenv("MARKET_MONITOR_COOLDOWN_SECONDS", str(30 * 60)))
+    config = _load_monitor_config()
+    watchlist = list(config.watchlist)
+    percent_threshold = config.percent_threshold
+    volume_multiplier = config.volume_multiplier
+    cooldown_seconds = config.cooldown_seconds
 
     try:
         queue_client = _load_queue_client()
     except RuntimeError as exc:
-        logging.error("Queue client initialization failed: %s", exc)
+        logger.error("Queue client initialization failed: %s", exc)
         return
 
     try:
         cooldown_store = _ensure_cosmos_store()
     except RuntimeError as exc:
-        logging.error("Cosmos configuration error: %s", exc)
+        logger.error("Cosmos configuration error: %s", exc)
         return
 
     cooldown_window = dt.timedelta(seconds=cooldown_seconds)
-    history_days = _history_window_days(volume_window)
+    history_days = config.history_days
     today_eastern = now_utc.astimezone(EASTERN).date()
     start_date = (today_eastern - dt.timedelta(days=history_days)).isoformat()
     end_date = today_eastern.isoformat()
 
-    logging.info("Monitoring %d tickers: %s (date range: %s to %s)", 
+    logger.info("Monitoring %d tickers: %s (date range: %s to %s)", 
                  len(watchlist), watchlist, start_date, end_date)
-    logging.info("Thresholds - Price change: %.2f%%, Volume multiplier: %.1fx, Cooldown: %ds",
+    logger.info("Thresholds - Price change: %.2f%%, Volume multiplier: %.1fx, Cooldown: %ds",
                  percent_threshold * 100, volume_multiplier, cooldown_seconds)
 
-    # Get interval settings for intraday monitoring
-    interval = os.getenv("MARKET_MONITOR_INTERVAL", "minute")
-    interval_multiplier = int(os.getenv("MARKET_MONITOR_INTERVAL_MULTIPLIER", "5"))
+    ctx = MonitorContext(
+        now_utc=now_utc,
+        today_eastern=today_eastern,
+        start_date=start_date,
+        end_date=end_date,
+        interval=config.interval,
+        interval_multiplier=config.interval_multiplier,
+        percent_threshold=percent_threshold,
+        volume_multiplier=volume_multiplier,
+        cooldown_window=cooldown_window,
+        analysis_window_minutes=config.analysis_window_minutes,
+        watchlist=watchlist,
+        watchlist_positions={ticker: position for position, ticker in enumerate(watchlist)},
+        queue_client=queue_client,
+        cooldown_store=cooldown_store,
+        # Fix #3: fast_monitor candidates from the last 5 minutes, one query for the whole watchlist
+        fast_candidates=_load_fast_candidates(cooldown_store, watchlist, now_utc - dt.timedelta(minutes=5)),
+        config=config,
+    )
 
-    for ticker in watchlist:
-        logging.info("Processing ticker: %s", ticker)
+    # Warm the cooldown cache with one query so workers skip per-ticker point reads
+    cooldown_store.get_last_triggers(watchlist)
 
-        # Fix #3: Check for fast_monitor candidates
-        fast_candidate = None
-        detection_method = "enhanced"
-        try:
-            # Query Cosmos for fast candidates from last 5 minutes
-            lookback_time = now_utc - dt.timedelta(minutes=5)
-            query = f"SELECT * FROM c WHERE c.ticker = '{ticker}' AND c.type = 'fast_candidate' AND c.status = 'pending_confirmation' AND c.detected_at >= '{_isoformat(lookback_time)}'"
-            candidates = list(cooldown_store._container.query_items(query=query, enable_cross_partition_query=True))
-
-            if candidates:
-                fast_candidate = candidates[0]  # Get most recent
-                logging.info("Found fast candidate for %s (detected at %s, confidence: %.2f)",
-                           ticker, fast_candidate.get("detected_at"), fast_candidate.get("confidence", 0))
-                detection_method = "fast_confirm"
-        except Exception as exc:
-            logging.error("Error querying fast candidates for %s: %s", ticker, exc)
+    # Per-ticker work is dominated by HTTP and Cosmos round-trips, so overlap it
+    enqueued = 0
+    with ThreadPoolExecutor(max_workers=min(_MAX_TICKER_WORKERS, len(watchlist))) as executor:
+        futures = {executor.submit(_process_ticker, ticker, ctx): ticker for ticker in watchlist}
+        for future in as_completed(futures):
+            try:
+                if future.result() is not None:
+                    enqueued += 1
+            except Exception as exc:  # noqa: BLE001 - one ticker must not abort the tick
+                logger.exception("Unhandled error processing %s: %s", futures[future], exc)
 
-        try:
-            # Fetch intraday prices (5-minute bars by default)
-            prices = _fetch_price_history(ticker, start_date, end_date, interval=interval, interval_multiplier=interval_multiplier)
-            logging.info("Fetched %d price records for %s (%s/%d interval)", len(prices), ticker, interval, interval_multiplier)
-
-            # Get previous day close for gap detection
-            prev_day = previous_trading_day(today_eastern)
-            prev_day_prices = _fetch_price_history(ticker, prev_day.isoformat(), prev_day.isoformat(), interval="day", interval_multiplier=1)
-            previous_close = prev_day_prices[-1].close if prev_day_prices else None
-
-        except Exception as exc:  # noqa: BLE001 - log and continue on data failure
-            logging.exception("Failed to fetch prices for %s: %s", ticker, exc)
-            continue
-
-        # Use enhanced signal detection with 9+ indicators
-        signal_result = enhanced_signal_detection(
-            ticker=ticker,
-            prices=prices,
-            previous_day_close=previous_close,
-            percent_threshold=percent_threshold,
-            volume_multiplier=volume_multiplier,
-            vwap_std_threshold=float(os.getenv("MARKET_MONITOR_VWAP_STD_THRESHOLD", "2.0")),
-            velocity_threshold=float(os.getenv("MARKET_MONITOR_VELOCITY_THRESHOLD", "0.001"))
-        )
+    logger.info("Market monitor execution completed (%d/%d tickers enqueued)", enqueued, len(watchlist))
 
-        # Fix #3: Combine fast candidate confidence with enhanced detection
-        combined_confidence = signal_result.confidence
-        if fast_candidate:
-            fast_conf = fast_candidate.get("confidence", 0)
-            # Weighted combination: 40% fast, 60% enhanced
-            combined_confidence = (fast_conf * 0.4) + (signal_result.confidence * 0.6)
-            signal_result.confidence = round(combined_confidence, 2)
 
-            # Update priority if combined confidence is higher
-            if combined_confidence > 0.85:
-                signal_result.priority = "critical"
-            elif combined_confidence > 0.75:
-                signal_result.priority = "high"
+def _fast_check(
+    ticker: str,
+    multi_client: MultiAPIClient,
+    cooldown_store: CosmosCooldownStore,
+    now_utc: dt.datetime,
+    fast_percent_threshold: float,
+    cooldown_window: dt.timedelta,
+) -> bool:
+    """Check one ticker for a fast move; returns True if a candidate was stored."""
+    logger.debug("Fast checking: %s", ticker)
 
-            logging.info("%s: Combined fast + enhanced confidence: %.2f (fast: %.2f, enhanced: %.2f)",
-                        ticker, combined_confidence, fast_conf, signal_result.confidence)
+    try:
+        # Get real-time quote
+        quote = multi_client.get_best_quote(ticker)
+        if not quote or quote.price <= 0:
+            logger.warning("No valid quote for %s", ticker)
+            return False
+
+        # Get recent intraday bars for context (1-minute bars from yfinance)
+        intraday = multi_client.get_intraday_series(ticker, interval_minutes=1, limit=60)
+
+        if len(intraday) < 5:
+            logger.warning("Insufficient intraday data for %s", ticker)
+            return False
+
+        # Quick checks for immediate signals
+        latest_price = quote.price
+        previous_price = float(intraday.close[-1])
+
+        if previous_price > 0:
+            instant_change = abs(latest_price - previous_price) / previous_price
+
+            if instant_change >= fast_percent_threshold:
+                logger.info("%s: Fast signal - Instant change %.2f%%", ticker, instant_change * 100)
+
+                # Check cooldown
+                last_trigger = cooldown_store.get_last_trigger(ticker)
+                if last_trigger and now_utc - last_trigger < cooldown_window:
+                    logger.info("Ticker %s in cooldown (last: %s)", ticker, last_trigger)
+                    return False
+
+                # This is a fast signal - log it for the 5-minute function to pick up
+                logger.info("🚨 FAST ALERT: %s moved %.2f%% in last minute", ticker, instant_change * 100)
+
+                # Store candidate signal in Cosmos for market_monitor to check (Fix #2)
+                # Calculate preliminary confidence for fast signal
+                fast_confidence = min(instant_change / fast_percent_threshold, 1.0) * 0.65
+
+                candidate_payload = {
+                    "id": f"{ticker}_fast_{int(now_utc.timestamp())}",
+                    "ticker": ticker,
+                    "type": "fast_candidate",
+                    "detected_at": _isoformat(now_utc),
+                    "trigger_price": latest_price,
+                    "instant_change": round(instant_change, 6),
+                    "confidence": round(fast_confidence, 2),
+                    "status": "pending_confirmation",
+                    "last_reasons": ["fast_movement"],
+                    "last_triggered_utc": _isoformat(now_utc),
+                }
 
-            # Mark candidate as confirmed
-            try:
-                fast_candidate["status"] = "confirmed"
-                fast_candidate["confirmed_at"] = _isoformat(now_utc)
-                fast_candidate["final_confidence"] = combined_confidence
-                cooldown_store._container.upsert_item(fast_candidate)
-            except Exception as exc:
-                logging.error("Failed to update fast candidate status for %s: %s", ticker, exc)
-
-        # Decision: send to queue if confidence meets threshold
-        min_confidence = float(os.getenv("MARKET_MONITOR_MIN_CONFIDENCE", "0.70"))
-
-        if not signal_result.triggered:
-            logging.info("%s: No signals triggered (confidence: %.2f, metrics: %s)",
-                        ticker, signal_result.confidence, signal_result.metrics)
-
-            # Mark fast candidate as rejected if exists
-            if fast_candidate:
-                try:
-                    fast_candidate["status"] = "rejected_no_confirmation"
-                    cooldown_store._container.upsert_item(fast_candidate)
-                except Exception:
-                    pass
-            continue
-
-        # Check if confidence meets threshold
-        if signal_result.confidence < min_confidence:
-            logging.info("%s: Signals triggered but confidence too low (%.2f < %.2f)",
-                        ticker, signal_result.confidence, min_confidence)
-
-            # Mark fast candidate as rejected if exists
-            if fast_candidate:
                 try:
-                    fast_candidate["status"] = "rejected_low_confidence"
-                    cooldown_store._container.upsert_item(fast_candidate)
-                except Exception:
-                    pass
-            continue
-
-        logging.info("%s: SIGNALS DETECTED - %s (confidence: %.2f, priority: %s, metrics: %s)",
-                    ticker, signal_result.reasons, signal_result.confidence,
-                    signal_result.priority, signal_result.metrics)
-
-        last_trigger = cooldown_store.get_last_trigger(ticker)
-        if last_trigger and now_utc - last_trigger < cooldown_window:
-            logging.info("Ticker %s skipped due to cooldown (last trigger at %s)", ticker, last_trigger)
-            continue
-
-        payload = _compose_queue_payload(ticker, now_utc, analysis_window_minutes, signal_result, watchlist, detection_method=detection_method, prices=prices)
-        try:
-            queue_client.send_message(json.dumps(payload))
-            logging.info("✓ Enqueued analysis request for %s - reasons: %s, confidence: %.2f, priority: %s",
-                        ticker, signal_result.reasons, signal_result.confidence, signal_result.priority)
-            cooldown_store.upsert_trigger(ticker, now_utc, signal_result.reasons)
-        except Exception as exc:  # noqa: BLE001 - surface queue issues
-            logging.exception("Failed to enqueue analysis for %s: %s", ticker, exc)
-    
-    logging.info("Market monitor execution completed")
+                    cooldown_store._container.upsert_item(candidate_payload)
+                    logger.info("✓ Stored fast candidate for %s (confidence: %.2f)", ticker, fast_confidence)
+                    return True
+                except Exception as exc:
+                    logger.error("Failed to store fast candidate for %s: %s", ticker, exc)
+
+    except Exception as exc:
+        logger.error("Fast monitor error for %s: %s", ticker, exc)
+        return False
+
+    return False
 
 
 @app.timer_trigger(schedule="0 * * * * *", arg_name="fast_timer", run_on_startup=False, use_monitor=False)
@@ -550,118 +987,178 @@ def fast_monitor(fast_timer: func.TimerRequest) -> None:
     Runs every 1 minute to catch rapid price movements
     Triggers the main 5-minute function for full analysis if signals detected
     """
-    logging.info("Fast monitor (1-min) triggered at %s", _format_schedule_status(fast_timer))
+    logger.info("Fast monitor (1-min) triggered at %s", _format_schedule_status(fast_timer))
 
     now_utc = dt.datetime.now(dt.timezone.utc)
 
     if not _is_market_hours(now_utc):
-        logging.info("Outside market hours - skipping fast monitor")
+        logger.info("Outside market hours - skipping fast monitor")
         return
 
-    logging.info("Fast monitor active - checking for immediate signals")
+    logger.info("Fast monitor active - checking for immediate signals")
 
-    watchlist_env = (
-        os.getenv("MARKET_MONITOR_WATCHLIST")
-        or os.getenv("WATCHLIST_TICKERS")
-        or os.getenv("DEFAULT_WATCHLIST")
-    )
-    watchlist = _parse_watchlist(watchlist_env)
-    if not watchlist:
-        watchlist = ["AAPL", "MSFT", "NVDA"]
+    config = _load_monitor_config()
+    watchlist = config.watchlist
 
     # Use multi-API client for real-time quotes
-    multi_client = MultiAPIClient()
-
-    # Fast detection thresholds (more aggressive)
-    fast_percent_threshold = float(os.getenv("FAST_MONITOR_PERCENT_THRESHOLD", "0.005"))  # 0.5%
-    fast_velocity_threshold = float(os.getenv("FAST_MONITOR_VELOCITY_THRESHOLD", "0.002"))  # 0.2% per minute
+    multi_client = _get_multi_client()
 
     try:
         cooldown_store = _ensure_cosmos_store()
     except RuntimeError as exc:
-        logging.error("Cosmos configuration error: %s", exc)
+        logger.error("Cosmos configuration error: %s", exc)
         return
 
-    cooldown_seconds = int(os.getenv("FAST_MONITOR_COOLDOWN_SECONDS", str(5 * 60)))  # 5 minutes
-    cooldown_window = dt.timedelta(seconds=cooldown_seconds)
+    cooldown_window = dt.timedelta(seconds=config.fast_cooldown_seconds)
+    cooldown_store.get_last_triggers(watchlist)
+
+    # Quote and bar requests dominate each check, so overlap them across tickers
+    check = partial(
+        _fast_check,
+        multi_client=multi_client,
+        cooldown_store=cooldown_store,
+        now_utc=now_utc,
+        fast_percent_threshold=config.fast_percent_threshold,
+        cooldown_window=cooldown_window,
+    )
+    with ThreadPoolExecutor(max_workers=min(_MAX_TICKER_WORKERS, len(watchlist))) as executor:
+        stored = sum(executor.map(check, watchlist))
 
-    for ticker in watchlist:
-        logging.info("Fast checking: %s", ticker)
+    logger.info("Fast monitor execution completed (%d candidates stored)", stored)
 
-        try:
-            # Get real-time quote
-            quote = multi_client.get_best_quote(ticker)
-            if not quote or quote.price <= 0:
-                logging.warning("No valid quote for %s", ticker)
-                continue
 
-            # Get recent intraday bars for context (1-minute bars from yfinance)
-            intraday_bars = multi_client.get_intraday_bars(ticker, interval_minutes=1, limit=60)
+@lru_cache(maxsize=1)
+def _exit_payload_template(user_id: str, strategy_id: str) -> dict:
+    # Fields shared by every EXIT message; callers merge in the per-signal ones
+    return {
+        "action": "exit_position",
+        "reason": "signal_invalidated",
+        "detection_method": "validation_exit",
+        "user_id": user_id,
+        "strategy_id": strategy_id,
+    }
 
-            if not intraday_bars or len(intraday_bars) < 5:
-                logging.warning("Insufficient intraday data for %s", ticker)
-                continue
 
-            # Convert to Price objects for signal detection
-            prices = [
-                Price(
-                    open=bar.open,
-                    high=bar.high,
-                    low=bar.low,
-                    close=bar.close,
-                    volume=bar.volume,
-                    time=bar.timestamp.isoformat()
-                )
-                for bar in intraday_bars
-            ]
-
-            # Quick checks for immediate signals
-            latest_price = quote.price
-            previous_price = prices[-1].close if prices else latest_price
-
-            if previous_price > 0:
-                instant_change = abs(latest_price - previous_price) / previous_price
-
-                if instant_change >= fast_percent_threshold:
-                    logging.info("%s: Fast signal - Instant change %.2f%%", ticker, instant_change * 100)
-
-                    # Check cooldown
-                    last_trigger = cooldown_store.get_last_trigger(ticker)
-                    if last_trigger and now_utc - last_trigger < cooldown_window:
-                        logging.info("Ticker %s in cooldown (last: %s)", ticker, last_trigger)
-                        continue
-
-                    # This is a fast signal - log it for the 5-minute function to pick up
-                    logging.info("🚨 FAST ALERT: %s moved %.2f%% in last minute", ticker, instant_change * 100)
-
-                    # Store candidate signal in Cosmos for market_monitor to check (Fix #2)
-                    # Calculate preliminary confidence for fast signal
-                    fast_confidence = min(instant_change / fast_percent_threshold, 1.0) * 0.65
-
-                    candidate_payload = {
-                        "id": f"{ticker}_fast_{int(now_utc.timestamp())}",
-                        "ticker": ticker,
-                        "type": "fast_candidate",
-                        "detected_at": _isoformat(now_utc),
-                        "trigger_price": latest_price,
-                        "instant_change": round(instant_change, 6),
-                        "confidence": round(fast_confidence, 2),
-                        "status": "pending_confirmation",
-                        "last_reasons": ["fast_movement"],
-                        "last_triggered_utc": _isoformat(now_utc),
-                    }
-
-                    try:
-                        cooldown_store._container.upsert_item(candidate_payload)
-                        logging.info("✓ Stored fast candidate for %s (confidence: %.2f)", ticker, fast_confidence)
-                    except Exception as exc:
-                        logging.error("Failed to store fast candidate for %s: %s", ticker, exc)
+def _validate_signal(
+    signal_doc: dict,
+    multi_client: MultiAPIClient,
+    cooldown_store: CosmosCooldownStore,
+    queue_client: QueueClient | None,
+    now_utc: dt.datetime,
+    config: MonitorConfig,
+) -> None:
+    """Score one confirmed fast candidate, send an EXIT if it fails, and store the result."""
+    ticker = signal_doc.get("ticker")
+    if not ticker:
+        return
+
+    try:
+        trigger_price = signal_doc.get("trigger_price", 0)
+        detected_at_str = signal_doc.get("detected_at", "")
+        signal_confidence = signal_doc.get("final_confidence", signal_doc.get("confidence", 0))
+
+        logger.debug("Validating signal for %s (trigger price: %.2f, confidence: %.2f)",
+                    ticker, trigger_price, signal_confidence)
+
+        # Get recent intraday bars for validation
+        series = multi_client.get_intraday_series(ticker, interval_minutes=5, limit=12)  # Last hour
+
+        if len(series) < 6:
+            logger.warning("Insufficient data for validation of %s", ticker)
+            return
 
+        # Momentum, RSI and volume all read from the same columns
+        closes = series.close
+        current_price = float(closes[-1])
+        price_change = (current_price - trigger_price) / trigger_price if trigger_price > 0 else 0
+        initial_direction = "bullish" if signal_doc.get("instant_change", 0) > 0 else "bearish"
+
+        # Calculate validation score (0-100)
+        validation_score = 0
+
+        # 1. Price moved in expected direction? (+30 points)
+        if trigger_price > 0:
+            if (initial_direction == "bullish" and price_change > 0) or \
+               (initial_direction == "bearish" and price_change < 0):
+                validation_score += 30
+                logger.debug("✓ %s: Price moved in expected direction (%.2f%%)",
+                           ticker, price_change * 100)
+            else:
+                logger.debug("✗ %s: Price reversed (%.2f%% vs expected %s)",
+                           ticker, price_change * 100, initial_direction)
+
+        # 2. Momentum continuing? (+20 points)
+        if len(series) >= 6:
+            # +1 per rising bar, -1 otherwise, over the first five bar-to-bar moves
+            recent_trend = int(np.where(np.diff(closes[:6]) > 0, 1, -1).sum())
+            if abs(recent_trend) >= 3:
+                validation_score += 20
+                logger.debug("✓ %s: Momentum confirmed (trend score: %d)", ticker, recent_trend)
+            else:
+                logger.debug("✗ %s: Weak momentum (trend score: %d)", ticker, recent_trend)
+
+        # 3. RSI confirms (not overbought/oversold)? (+20 points)
+        rsi = calculate_rsi(series, period=14)
+        if 30 < rsi < 70:
+            validation_score += 20
+            logger.debug("✓ %s: RSI neutral (%.2f)", ticker, rsi)
+        else:
+            logger.debug("⚠️  %s: RSI extreme (%.2f)", ticker, rsi)
+
+        # 4. Volume sustained? (+30 points)
+        recent_volume = float(series.volume[-3:].mean())
+        earlier_volume = float(series.volume[-9:-3].mean())
+        if earlier_volume > 0 and recent_volume / earlier_volume >= 0.8:
+            validation_score += 30
+            logger.debug("✓ %s: Volume sustained (%.2fx)", ticker, recent_volume / earlier_volume)
+        else:
+            logger.debug("✗ %s: Volume dropped", ticker)
+
+        logger.info("%s: Validation score: %d/100", ticker, validation_score)
+
+        # Update signal document with validation results
+        signal_doc["validation_score"] = validation_score
+        validated_at = _isoformat(now_utc)
+        signal_doc["validated_at"] = validated_at
+        signal_doc["validation_rsi"] = rsi
+        signal_doc["validation_price"] = current_price
+        signal_doc["validation_price_change"] = round(price_change, 6)
+
+        # Decision: Send EXIT signal if validation fails badly
+        exit_threshold = config.validation_exit_threshold
+
+        if validation_score < exit_threshold:
+            logger.warning("🚨 VALIDATION FAILED for %s (score: %d < %d) - Sending EXIT signal",
+                          ticker, validation_score, exit_threshold)
+
+            signal_doc["status"] = "invalidated"
+            signal_doc["exit_signal_sent"] = True
+
+            # Send EXIT message to queue
+            if queue_client:
+                exit_payload = _exit_payload_template(config.user_id, config.strategy_id) | {
+                    "tickers": [ticker],
+                    "validation_score": validation_score,
+                    "triggered_at": validated_at,
+                }
+
+                try:
+                    queue_client.send_message(orjson.dumps(exit_payload, option=_QUEUE_JSON_OPTIONS).decode())
+                    logger.info("✓ EXIT signal sent for %s (validation failed)", ticker)
+                except Exception as exc:
+                    logger.error("Failed to send EXIT signal for %s: %s", ticker, exc)
+        else:
+            logger.info("✓ %s: Validation passed (score: %d)", ticker, validation_score)
+            signal_doc["status"] = "validated"
+
+        # Store validation results
+        try:
+            cooldown_store._container.upsert_item(signal_doc)
         except Exception as exc:
-            logging.error("Fast monitor error for %s: %s", ticker, exc)
-            continue
+            logger.error("Failed to update validation for %s: %s", ticker, exc)
 
-    logging.info("Fast monitor execution completed")
+    except Exception as exc:
+        logger.error("Validation error for %s: %s", ticker, exc)
 
 
 @app.timer_trigger(schedule="0 */15 * * * *", arg_name="validation_timer", run_on_startup=False, use_monitor=False)
@@ -671,176 +1168,55 @@ def validation_monitor(validation_timer: func.TimerRequest) -> None:
     Uses Alpha Vantage for technical indicators validation
     Checks for false positives and provides additional context
     """
-    logging.info("Validation monitor (15-min) triggered at %s", _format_schedule_status(validation_timer))
+    logger.info("Validation monitor (15-min) triggered at %s", _format_schedule_status(validation_timer))
 
     now_utc = dt.datetime.now(dt.timezone.utc)
 
     if not _is_market_hours(now_utc):
-        logging.info("Outside market hours - skipping validation monitor")
+        logger.info("Outside market hours - skipping validation monitor")
         return
 
-    logging.info("Validation monitor active - checking recent signals")
-
-    watchlist_env = (
-        os.getenv("MARKET_MONITOR_WATCHLIST")
-        or os.getenv("WATCHLIST_TICKERS")
-        or os.getenv("DEFAULT_WATCHLIST")
-    )
-    watchlist = _parse_watchlist(watchlist_env)
-    if not watchlist:
-        watchlist = ["AAPL", "MSFT", "NVDA"]
+    logger.info("Validation monitor active - checking recent signals")
 
     try:
         cooldown_store = _ensure_cosmos_store()
     except RuntimeError as exc:
-        logging.error("Cosmos configuration error: %s", exc)
+        logger.error("Cosmos configuration error: %s", exc)
         return
 
     # Fix #5: Query Cosmos for confirmed signals in last 15 minutes
     lookback_time = now_utc - dt.timedelta(minutes=15)
-    multi_client = MultiAPIClient()
+    multi_client = _get_multi_client()
 
     try:
         queue_client = _load_queue_client()
     except RuntimeError as exc:
-        logging.error("Queue client initialization failed: %s", exc)
+        logger.error("Queue client initialization failed: %s", exc)
         queue_client = None
 
     # Query for confirmed candidates that need validation
     try:
-        query = f"SELECT * FROM c WHERE c.type = 'fast_candidate' AND c.status = 'confirmed' AND c.confirmed_at >= '{_isoformat(lookback_time)}'"
-        confirmed_signals = list(cooldown_store._container.query_items(query=query, enable_cross_partition_query=True))
-        logging.info("Found %d confirmed signals to validate", len(confirmed_signals))
+        query = "SELECT * FROM c WHERE c.type = 'fast_candidate' AND c.status = 'confirmed' AND c.confirmed_at >= @since"
+        parameters = [{"name": "@since", "value": _isoformat(lookback_time)}]
+        confirmed_signals = list(cooldown_store._container.query_items(
+            query=query, parameters=parameters, enable_cross_partition_query=True
+        ))
+        logger.info("Found %d confirmed signals to validate", len(confirmed_signals))
     except Exception as exc:
-        logging.error("Error querying confirmed signals: %s", exc)
+        logger.error("Error querying confirmed signals: %s", exc)
         confirmed_signals = []
 
-    for signal_doc in confirmed_signals:
-        ticker = signal_doc.get("ticker")
-        if not ticker:
-            continue
-
-        try:
-            trigger_price = signal_doc.get("trigger_price", 0)
-            detected_at_str = signal_doc.get("detected_at", "")
-            signal_confidence = signal_doc.get("final_confidence", signal_doc.get("confidence", 0))
-
-            logging.info("Validating signal for %s (trigger price: %.2f, confidence: %.2f)",
-                        ticker, trigger_price, signal_confidence)
-
-            # Get recent intraday bars for validation
-            bars = multi_client.get_intraday_bars(ticker, interval_minutes=5, limit=12)  # Last hour
-
-            if not bars or len(bars) < 6:
-                logging.warning("Insufficient data for validation of %s", ticker)
-                continue
-
-            # Convert to Price objects for RSI calculation
-            prices = [
-                Price(
-                    open=bar.open,
-                    high=bar.high,
-                    low=bar.low,
-                    close=bar.close,
-                    volume=bar.volume,
-                    time=bar.timestamp.isoformat()
-                )
-                for bar in bars
-            ]
-
-            current_price = bars[-1].close
-            initial_direction = "bullish" if signal_doc.get("instant_change", 0) > 0 else "bearish"
-
-            # Calculate validation score (0-100)
-            validation_score = 0
-
-            # 1. Price moved in expected direction? (+30 points)
-            if trigger_price > 0:
-                price_change = (current_price - trigger_price) / trigger_price
-                if (initial_direction == "bullish" and price_change > 0) or \
-                   (initial_direction == "bearish" and price_change < 0):
-                    validation_score += 30
-                    logging.info("✓ %s: Price moved in expected direction (%.2f%%)",
-                               ticker, price_change * 100)
-                else:
-                    logging.info("✗ %s: Price reversed (%.2f%% vs expected %s)",
-                               ticker, price_change * 100, initial_direction)
-
-            # 2. Momentum continuing? (+20 points)
-            if len(bars) >= 6:
-                recent_trend = sum(1 if bars[i].close > bars[i-1].close else -1 for i in range(1, 6))
-                if abs(recent_trend) >= 3:
-                    validation_score += 20
-                    logging.info("✓ %s: Momentum confirmed (trend score: %d)", ticker, recent_trend)
-                else:
-                    logging.info("✗ %s: Weak momentum (trend score: %d)", ticker, recent_trend)
-
-            # 3. RSI confirms (not overbought/oversold)? (+20 points)
-            rsi = calculate_rsi(prices, period=14)
-            if 30 < rsi < 70:
-                validation_score += 20
-                logging.info("✓ %s: RSI neutral (%.2f)", ticker, rsi)
-            else:
-                logging.info("⚠️  %s: RSI extreme (%.2f)", ticker, rsi)
-
-            # 4. Volume sustained? (+30 points)
-            recent_volume = sum(bar.volume for bar in bars[-3:]) / 3
-            earlier_volume = sum(bar.volume for bar in bars[-9:-3]) / 6
-            if earlier_volume > 0 and recent_volume / earlier_volume >= 0.8:
-                validation_score += 30
-                logging.info("✓ %s: Volume sustained (%.2fx)", ticker, recent_volume / earlier_volume)
-            else:
-                logging.info("✗ %s: Volume dropped", ticker)
-
-            logging.info("%s: Validation score: %d/100", ticker, validation_score)
-
-            # Update signal document with validation results
-            signal_doc["validation_score"] = validation_score
-            signal_doc["validated_at"] = _isoformat(now_utc)
-            signal_doc["validation_rsi"] = rsi
-            signal_doc["validation_price"] = current_price
-            signal_doc["validation_price_change"] = round((current_price - trigger_price) / trigger_price, 6) if trigger_price > 0 else 0
-
-            # Decision: Send EXIT signal if validation fails badly
-            exit_threshold = int(os.getenv("VALIDATION_EXIT_THRESHOLD", "30"))
-
-            if validation_score < exit_threshold:
-                logging.warning("🚨 VALIDATION FAILED for %s (score: %d < %d) - Sending EXIT signal",
-                              ticker, validation_score, exit_threshold)
-
-                signal_doc["status"] = "invalidated"
-                signal_doc["exit_signal_sent"] = True
-
-                # Send EXIT message to queue
-                if queue_client:
-                    exit_payload = {
-                        "action": "exit_position",
-                        "tickers": [ticker],
-                        "reason": "signal_invalidated",
-                        "validation_score": validation_score,
-                        "triggered_at": _isoformat(now_utc),
-                        "detection_method": "validation_exit",
-                        "user_id": os.getenv("MARKET_MONITOR_USER_ID", "market-monitor"),
-                        "strategy_id": os.getenv("MARKET_MONITOR_STRATEGY_ID", "auto-signal"),
-                    }
-
-                    try:
-                        queue_client.send_message(json.dumps(exit_payload))
-                        logging.info("✓ EXIT signal sent for %s (validation failed)", ticker)
-                    except Exception as exc:
-                        logging.error("Failed to send EXIT signal for %s: %s", ticker, exc)
-            else:
-                logging.info("✓ %s: Validation passed (score: %d)", ticker, validation_score)
-                signal_doc["status"] = "validated"
-
-            # Store validation results
-            try:
-                cooldown_store._container.upsert_item(signal_doc)
-            except Exception as exc:
-                logging.error("Failed to update validation for %s: %s", ticker, exc)
-
-        except Exception as exc:
-            logging.error("Validation error for %s: %s", ticker, exc)
-            continue
+    # Each validation waits on a bar fetch and a Cosmos write, so overlap them
+    if confirmed_signals:
+        validate = partial(
+            _validate_signal,
+            multi_client=multi_client,
+            cooldown_store=cooldown_store,
+            queue_client=queue_client,
+            now_utc=now_utc,
+            config=_load_monitor_config(),
+        )
+        with ThreadPoolExecutor(max_workers=min(_MAX_TICKER_WORKERS, len(confirmed_signals))) as executor:
+            list(executor.map(validate, confirmed_signals))
 
-    logging.info("Validation monitor execution completed")
+    logger.info("Validation monitor execution completed")
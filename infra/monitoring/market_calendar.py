@@ -2,6 +2,8 @@
 US Stock Market Calendar with holiday handling
 """
 from datetime import date, datetime, time
+from functools import lru_cache
+from typing import Optional
 from zoneinfo import ZoneInfo
 
 EASTERN = ZoneInfo("America/New_York")
@@ -47,8 +49,8 @@ US_MARKET_HOLIDAYS_2026 = [
     date(2026, 12, 25), # Christmas
 ]
 
-# Combine all holidays
-ALL_HOLIDAYS = set(US_MARKET_HOLIDAYS_2024 + US_MARKET_HOLIDAYS_2025 + US_MARKET_HOLIDAYS_2026)
+# Combine all holidays (frozen: the lookup bitmaps below are derived from it at import)
+ALL_HOLIDAYS = frozenset(US_MARKET_HOLIDAYS_2024 + US_MARKET_HOLIDAYS_2025 + US_MARKET_HOLIDAYS_2026)
 
 # Early close days (typically 1:00 PM ET close)
 EARLY_CLOSE_DAYS_2024 = [
@@ -69,17 +71,43 @@ EARLY_CLOSE_DAYS_2026 = [
     date(2026, 12, 24), # Christmas Eve
 ]
 
-ALL_EARLY_CLOSE_DAYS = set(EARLY_CLOSE_DAYS_2024 + EARLY_CLOSE_DAYS_2025 + EARLY_CLOSE_DAYS_2026)
+ALL_EARLY_CLOSE_DAYS = frozenset(EARLY_CLOSE_DAYS_2024 + EARLY_CLOSE_DAYS_2025 + EARLY_CLOSE_DAYS_2026)
+
+
+def _month_key(check_date: date) -> int:
+    return check_date.year * 12 + check_date.month
+
+
+def _month_bitmap(days: frozenset[date]) -> dict[int, int]:
+    """Pack dates into one int per month, with bit (day - 1) set for each listed day"""
+    bits: dict[int, int] = {}
+    for day in days:
+        key = _month_key(day)
+        bits[key] = bits.get(key, 0) | 1 << (day.day - 1)
+    return bits
+
+
+# Lookups test a bit instead of hashing date objects
+_HOLIDAY_BITS = _month_bitmap(ALL_HOLIDAYS)
+_EARLY_CLOSE_BITS = _month_bitmap(ALL_EARLY_CLOSE_DAYS)
+
+# Holidays as day ordinals, for scanning days without building date objects
+_HOLIDAY_ORDINALS = frozenset(day.toordinal() for day in ALL_HOLIDAYS)
+
+
+def _is_trading_ordinal(ordinal: int) -> bool:
+    # Ordinal 1 (0001-01-01) is a Monday, so (ordinal + 6) % 7 matches date.weekday()
+    return (ordinal + 6) % 7 < 5 and ordinal not in _HOLIDAY_ORDINALS
 
 
 def is_market_holiday(check_date: date) -> bool:
     """Check if a given date is a market holiday"""
-    return check_date in ALL_HOLIDAYS
+    return bool(_HOLIDAY_BITS.get(_month_key(check_date), 0) >> (check_date.day - 1) & 1)
 
 
 def is_early_close_day(check_date: date) -> bool:
     """Check if a given date is an early close day"""
-    return check_date in ALL_EARLY_CLOSE_DAYS
+    return bool(_EARLY_CLOSE_BITS.get(_month_key(check_date), 0) >> (check_date.day - 1) & 1)
 
 
 def is_market_open(now: datetime = None) -> bool:
@@ -94,31 +122,40 @@ def is_market_open(now: datetime = None) -> bool:
     """
     if now is None:
         now = datetime.now(EASTERN)
-    else:
-        now = now.astimezone(EASTERN)
 
-    # Check if weekend
-    if now.weekday() >= 5:  # Saturday=5, Sunday=6
-        return False
+    # Resolved at one-second granularity; the timers and pollers that share a
+    # second reuse the answer
+    return _is_open_at(int(now.timestamp()))
 
-    # Check if holiday
-    if is_market_holiday(now.date()):
-        return False
 
-    # Check market hours
-    market_open_time = time(9, 30)  # 9:30 AM ET
+@lru_cache(maxsize=2)
+def _is_open_at(epoch_second: int) -> bool:
+    now = datetime.fromtimestamp(epoch_second, EASTERN)
 
-    # Check for early close
-    if is_early_close_day(now.date()):
-        market_close_time = time(13, 0)  # 1:00 PM ET
-    else:
-        market_close_time = time(16, 0)  # 4:00 PM ET
+    # Weekends and holidays have no session
+    session = get_trading_session(now.date())
+    if session is None:
+        return False
 
+    market_open_time, market_close_time = session
     current_time = now.time()
 
     return market_open_time <= current_time <= market_close_time
 
 
+@lru_cache(maxsize=8)
+def get_trading_session(check_date: date) -> Optional[tuple[time, time]]:
+    """
+    Get the (open, close) times in ET for a given date, or None if the market is closed all day
+
+    Cached per date, so the timers only resolve weekends, holidays and early
+    closes once a day instead of on every tick.
+    """
+    if not is_trading_day(check_date):
+        return None
+    return time(9, 30), get_market_close_time(check_date)  # 9:30 AM ET open
+
+
 def get_market_close_time(check_date: date) -> time:
     """Get the market close time for a given date"""
     if is_early_close_day(check_date):
@@ -128,11 +165,8 @@ def get_market_close_time(check_date: date) -> time:
 
 def is_trading_day(check_date: date) -> bool:
     """Check if a given date is a trading day (not weekend or holiday)"""
-    # Create a datetime for the date
-    dt = datetime.combine(check_date, time(12, 0), tzinfo=EASTERN)
-
     # Check if weekend
-    if dt.weekday() >= 5:
+    if check_date.weekday() >= 5:
         return False
 
     # Check if holiday
@@ -147,11 +181,7 @@ def next_trading_day(from_date: date = None) -> date:
     if from_date is None:
         from_date = datetime.now(EASTERN).date()
 
-    check_date = from_date
-    while True:
-        check_date = date.fromordinal(check_date.toordinal() + 1)
-        if is_trading_day(check_date):
-            return check_date
+    return date.fromordinal(_next_trading_ordinal(from_date.toordinal()))
 
 
 def previous_trading_day(from_date: date = None) -> date:
@@ -159,8 +189,22 @@ def previous_trading_day(from_date: date = None) -> date:
     if from_date is None:
         from_date = datetime.now(EASTERN).date()
 
-    check_date = from_date
-    while True:
-        check_date = date.fromordinal(check_date.toordinal() - 1)
-        if is_trading_day(check_date):
-            return check_date
+    return date.fromordinal(_previous_trading_ordinal(from_date.toordinal()))
+
+
+# The scans are pure functions of the starting day, and callers (the monitors
+# each tick, backtests per bar) ask about the same few days over and over
+@lru_cache(maxsize=4096)
+def _next_trading_ordinal(ordinal: int) -> int:
+    ordinal += 1
+    while not _is_trading_ordinal(ordinal):
+        ordinal += 1
+    return ordinal
+
+
+@lru_cache(maxsize=4096)
+def _previous_trading_ordinal(ordinal: int) -> int:
+    ordinal -= 1
+    while not _is_trading_ordinal(ordinal):
+        ordinal -= 1
+    return ordinal
@@ -4,12 +4,75 @@ Integrates: Finnhub, Polygon, Alpha Vantage, yfinance (all free tiers)
 """
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional
 
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from signal_detection import PriceSeries
+
+
+def _pooled_session() -> requests.Session:
+    """
+    Session that keeps TLS connections alive between calls.
+
+    Sized for the monitors' ticker fan-out, and retries dropped connections
+    and transient 5xx responses briefly so one blip does not cost a ticker
+    its data for the tick. 429s are not retried, even when they carry
+    Retry-After: the free tiers meter per minute or per day, so a retry only
+    burns quota and blocks the timer thread.
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            # Otherwise urllib3 retries any 429 that sends Retry-After
+            respect_retry_after_header=False,
+            # Hand the last response back so callers log its status as before
+            raise_on_status=False,
+        ),
+    ))
+    return session
+
+
+class _TTLCache:
+    """Exact-match cache whose entries expire ``ttl`` seconds after being stored"""
+
+    def __init__(self, ttl: float, maxsize: int = 512):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # key -> (expires_at on the monotonic clock, value); writes are locked
+        # because the monitors call the clients from worker threads
+        self._entries: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def put(self, key, value) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if len(self._entries) >= self.maxsize:
+                self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+                if len(self._entries) >= self.maxsize:
+                    # Still full of live entries: drop the oldest insertion
+                    self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (now + self.ttl, value)
 
 
 @dataclass
@@ -57,8 +120,11 @@ class FinnhubClient:
 
     BASE_URL = "https://finnhub.io/api/v1"
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, session: requests.Session = None):
         self.api_key = api_key or os.getenv("FINNHUB_API_KEY")
+        self.session = session or _pooled_session()
+        # Quotes are real-time, so only absorb repeat polls within a few seconds
+        self._quote_cache = _TTLCache(ttl=5)
         if not self.api_key:
             logging.warning("FINNHUB_API_KEY not set, Finnhub integration disabled")
 
@@ -67,19 +133,23 @@ class FinnhubClient:
         if not self.api_key:
             return None
 
+        cached = self._quote_cache.get(ticker)
+        if cached is not None:
+            return cached
+
         try:
             url = f"{self.BASE_URL}/quote"
             params = {"symbol": ticker, "token": self.api_key}
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
 
             if response.status_code != 200:
                 logging.warning(f"Finnhub quote failed for {ticker}: {response.status_code}")
                 return None
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Finnhub returns: c (current), h (high), l (low), o (open), pc (previous close), t (timestamp)
-            return Quote(
+            quote = Quote(
                 ticker=ticker,
                 price=data.get("c", 0.0),
                 bid=data.get("c", 0.0),  # Finnhub doesn't provide bid/ask in free tier
@@ -90,6 +160,8 @@ class FinnhubClient:
                 timestamp=datetime.fromtimestamp(data.get("t", time.time()), tz=timezone.utc),
                 source="finnhub"
             )
+            self._quote_cache.put(ticker, quote)
+            return quote
         except Exception as exc:
             logging.error(f"Finnhub error for {ticker}: {exc}")
             return None
@@ -107,10 +179,10 @@ class FinnhubClient:
                 "to": to_date or datetime.now().strftime("%Y-%m-%d"),
                 "token": self.api_key
             }
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
 
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             return []
         except Exception as exc:
             logging.error(f"Finnhub news error for {ticker}: {exc}")
@@ -122,8 +194,9 @@ class PolygonClient:
 
     BASE_URL = "https://api.polygon.io/v2"
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, session: requests.Session = None):
         self.api_key = api_key or os.getenv("POLYGON_API_KEY")
+        self.session = session or _pooled_session()
         if not self.api_key:
             logging.warning("POLYGON_API_KEY not set, Polygon integration disabled")
 
@@ -135,10 +208,10 @@ class PolygonClient:
         try:
             url = f"{self.BASE_URL}/aggs/ticker/{ticker}/prev"
             params = {"apiKey": self.api_key}
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if data.get("results"):
                     return data["results"][0]
             return None
@@ -146,6 +219,20 @@ class PolygonClient:
             logging.error(f"Polygon error for {ticker}: {exc}")
             return None
 
+    def _fetch_aggregates(self, ticker: str, multiplier: int, timespan: str,
+                          from_date: str, to_date: str, limit: int) -> list[dict]:
+        """Fetch raw aggregate results, oldest first"""
+        # Format: /v2/aggs/ticker/{ticker}/range/{multiplier}/{timespan}/{from}/{to}
+        url = f"{self.BASE_URL}/aggs/ticker/{ticker}/range/{multiplier}/{timespan}/{from_date}/{to_date}"
+        params = {"adjusted": "true", "sort": "asc", "limit": limit, "apiKey": self.api_key}
+        response = self.session.get(url, params=params, timeout=10)
+
+        if response.status_code != 200:
+            logging.warning(f"Polygon aggregates failed for {ticker}: {response.status_code}")
+            return []
+
+        return orjson.loads(response.content).get("results", [])
+
     def get_aggregates(self, ticker: str, multiplier: int = 1, timespan: str = "minute",
                       from_date: str = None, to_date: str = None, limit: int = 120) -> list[IntradayBar]:
         """Get aggregate bars (free tier: limited)"""
@@ -153,19 +240,10 @@ class PolygonClient:
             return []
 
         try:
-            # Format: /v2/aggs/ticker/{ticker}/range/{multiplier}/{timespan}/{from}/{to}
-            url = f"{self.BASE_URL}/aggs/ticker/{ticker}/range/{multiplier}/{timespan}/{from_date}/{to_date}"
-            params = {"adjusted": "true", "sort": "asc", "limit": limit, "apiKey": self.api_key}
-            response = requests.get(url, params=params, timeout=10)
-
-            if response.status_code != 200:
-                logging.warning(f"Polygon aggregates failed for {ticker}: {response.status_code}")
-                return []
-
-            data = response.json()
+            results = self._fetch_aggregates(ticker, multiplier, timespan, from_date, to_date, limit)
             bars = []
 
-            for bar in data.get("results", []):
+            for bar in results:
                 bars.append(IntradayBar(
                     ticker=ticker,
                     open=bar["o"],
@@ -183,14 +261,41 @@ class PolygonClient:
             logging.error(f"Polygon aggregates error for {ticker}: {exc}")
             return []
 
+    def get_aggregates_series(self, ticker: str, multiplier: int = 1, timespan: str = "minute",
+                              from_date: str = None, to_date: str = None, limit: int = 120) -> PriceSeries:
+        """
+        Get aggregate bars as OHLCV columns, for callers that only run indicator math.
+
+        Copies the raw results column-wise without building an IntradayBar
+        (and tz-aware datetime) per bar; epoch-millisecond bar times become a
+        datetime64[ms] column. Returns an empty series on failure.
+        """
+        if not self.api_key:
+            return PriceSeries.from_rows([])
+
+        try:
+            results = self._fetch_aggregates(ticker, multiplier, timespan, from_date, to_date, limit)
+            return PriceSeries.from_rows(
+                [(bar["o"], bar["h"], bar["l"], bar["c"], bar["v"]) for bar in results],
+                timestamp=np.array([bar["t"] for bar in results], dtype="datetime64[ms]"),
+            )
+        except Exception as exc:
+            logging.error(f"Polygon aggregates error for {ticker}: {exc}")
+            return PriceSeries.from_rows([])
+
 
 class AlphaVantageClient:
     """Alpha Vantage API client for technical indicators"""
 
     BASE_URL = "https://www.alphavantage.co/query"
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, session: requests.Session = None):
         self.api_key = api_key or os.getenv("ALPHA_VANTAGE_API_KEY")
+        self.session = session or _pooled_session()
+        # 25 calls/day: reuse indicator values for a few minutes and intraday
+        # series for a minute (the fast monitor reads 1-minute bars)
+        self._rsi_cache = _TTLCache(ttl=300)
+        self._intraday_cache = _TTLCache(ttl=60)
         if not self.api_key:
             logging.warning("ALPHA_VANTAGE_API_KEY not set, Alpha Vantage integration disabled")
 
@@ -199,6 +304,11 @@ class AlphaVantageClient:
         if not self.api_key:
             return None
 
+        cache_key = (ticker, interval, time_period)
+        cached = self._rsi_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             params = {
                 "function": "RSI",
@@ -208,15 +318,17 @@ class AlphaVantageClient:
                 "series_type": "close",
                 "apikey": self.api_key
             }
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
+            response = self.session.get(self.BASE_URL, params=params, timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 technical_analysis = data.get("Technical Analysis: RSI", {})
                 if technical_analysis:
-                    # Get most recent value
-                    latest_time = sorted(technical_analysis.keys(), reverse=True)[0]
-                    return float(technical_analysis[latest_time]["RSI"])
+                    # Get most recent value; ISO timestamp keys order lexically
+                    latest_time = max(technical_analysis)
+                    rsi = float(technical_analysis[latest_time]["RSI"])
+                    self._rsi_cache.put(cache_key, rsi)
+                    return rsi
             return None
         except Exception as exc:
             logging.error(f"Alpha Vantage RSI error for {ticker}: {exc}")
@@ -227,6 +339,10 @@ class AlphaVantageClient:
         if not self.api_key:
             return []
 
+        cached = self._intraday_cache.get((ticker, interval))
+        if cached is not None:
+            return cached
+
         try:
             params = {
                 "function": "TIME_SERIES_INTRADAY",
@@ -235,12 +351,12 @@ class AlphaVantageClient:
                 "apikey": self.api_key,
                 "outputsize": "compact"  # Last 100 data points
             }
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
+            response = self.session.get(self.BASE_URL, params=params, timeout=10)
 
             if response.status_code != 200:
                 return []
 
-            data = response.json()
+            data = orjson.loads(response.content)
             time_series = data.get(f"Time Series ({interval})", {})
             bars = []
 
@@ -252,10 +368,14 @@ class AlphaVantageClient:
                     low=float(values["3. low"]),
                     close=float(values["4. close"]),
                     volume=int(values["5. volume"]),
-                    timestamp=datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+                    # "YYYY-MM-DD HH:MM:SS" is ISO 8601; fromisoformat is far cheaper than strptime
+                    timestamp=datetime.fromisoformat(timestamp_str).replace(tzinfo=timezone.utc)
                 ))
 
-            return sorted(bars, key=lambda x: x.timestamp)
+            bars.sort(key=lambda x: x.timestamp)
+            if bars:
+                self._intraday_cache.put((ticker, interval), bars)
+            return bars
         except Exception as exc:
             logging.error(f"Alpha Vantage intraday error for {ticker}: {exc}")
             return []
@@ -269,17 +389,19 @@ class YFinanceClient:
         try:
             import yfinance as yf
 
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            # fast_info reads price fields from the chart endpoint; .info scrapes
+            # several quoteSummary modules for hundreds of fields we never use
+            info = yf.Ticker(ticker).fast_info
+            price = info.get("last_price") or 0.0
 
             return Quote(
                 ticker=ticker,
-                price=info.get("currentPrice", info.get("regularMarketPrice", 0.0)),
-                bid=info.get("bid", 0.0),
-                ask=info.get("ask", 0.0),
-                bid_size=info.get("bidSize", 0),
-                ask_size=info.get("askSize", 0),
-                volume=info.get("volume", 0),
+                price=price,
+                bid=price,  # fast_info doesn't provide bid/ask
+                ask=price,
+                bid_size=0,
+                ask_size=0,
+                volume=int(info.get("last_volume") or 0),
                 timestamp=datetime.now(timezone.utc),
                 source="yfinance"
             )
@@ -318,10 +440,68 @@ class YFinanceClient:
             logging.error(f"yfinance intraday error for {ticker}: {exc}")
             return []
 
+    def get_intraday_batch(self, tickers: list[str], period: str = "1d", interval: str = "1m") -> dict[str, list[IntradayBar]]:
+        """Get intraday data for several tickers in one download; tickers with no rows are left out"""
+        try:
+            import yfinance as yf
+
+            hist = yf.download(tickers, period=period, interval=interval, group_by="ticker",
+                               threads=True, progress=False)
+
+            result = {}
+            for ticker in tickers:
+                if ticker not in hist.columns.get_level_values(0):
+                    continue
+                # Rows are aligned across tickers, so drop the ones this ticker lacks
+                frame = hist[ticker].dropna(how="all")
+                bars = [
+                    IntradayBar(
+                        ticker=ticker,
+                        open=open_,
+                        high=high,
+                        low=low,
+                        close=close,
+                        volume=int(volume),
+                        timestamp=idx.to_pydatetime().replace(tzinfo=timezone.utc)
+                    )
+                    for idx, open_, high, low, close, volume in zip(
+                        frame.index, frame["Open"], frame["High"], frame["Low"], frame["Close"], frame["Volume"]
+                    )
+                ]
+                if bars:
+                    result[ticker] = bars
+
+            return result
+        except ImportError:
+            logging.warning("yfinance not installed")
+            return {}
+        except Exception as exc:
+            logging.error(f"yfinance batch intraday error for {tickers}: {exc}")
+            return {}
+
+    def get_intraday_series(self, ticker: str, period: str = "1d", interval: str = "1m") -> Optional[PriceSeries]:
+        """Get intraday data as OHLCV columns, straight from the history frame"""
+        try:
+            import yfinance as yf
+
+            hist = yf.Ticker(ticker).history(period=period, interval=interval)
+            return PriceSeries(
+                *(hist[column].to_numpy(dtype=np.float64) for column in ("Open", "High", "Low", "Close", "Volume"))
+            )
+        except ImportError:
+            logging.warning("yfinance not installed")
+            return None
+        except Exception as exc:
+            logging.error(f"yfinance intraday error for {ticker}: {exc}")
+            return None
+
 
 class MultiAPIClient:
     """Unified client that tries multiple APIs with fallback"""
 
+    YF_INTERVALS = {1: "1m", 5: "5m", 15: "15m", 30: "30m", 60: "1h"}
+    AV_INTERVALS = {1: "1min", 5: "5min", 15: "15min", 30: "30min", 60: "60min"}
+
     def __init__(self):
         self.finnhub = FinnhubClient()
         self.polygon = PolygonClient()
@@ -343,19 +523,27 @@ class MultiAPIClient:
         logging.warning(f"Failed to get quote for {ticker} from all sources")
         return None
 
+    def get_best_quotes(self, tickers: list[str]) -> dict[str, Quote]:
+        """Get quotes for several tickers concurrently; tickers with no quote are left out"""
+        if not tickers:
+            return {}
+
+        # Each lookup is a chain of HTTP round-trips, so overlap them across tickers
+        with ThreadPoolExecutor(max_workers=min(32, len(tickers))) as executor:
+            quotes = executor.map(self.get_best_quote, tickers)
+            return {ticker: quote for ticker, quote in zip(tickers, quotes) if quote is not None}
+
     def get_intraday_bars(self, ticker: str, interval_minutes: int = 5, limit: int = 120) -> list[IntradayBar]:
         """Get intraday bars from the best available source"""
         # Try yfinance first (no API key needed, reliable)
-        interval_map = {1: "1m", 5: "5m", 15: "15m", 30: "30m", 60: "1h"}
-        yf_interval = interval_map.get(interval_minutes, "5m")
+        yf_interval = self.YF_INTERVALS.get(interval_minutes, "5m")
         bars = self.yfinance.get_intraday(ticker, period="1d", interval=yf_interval)
 
         if bars:
             return bars[-limit:]
 
         # Fallback to Alpha Vantage
-        av_interval_map = {1: "1min", 5: "5min", 15: "15min", 30: "30min", 60: "60min"}
-        av_interval = av_interval_map.get(interval_minutes, "5min")
+        av_interval = self.AV_INTERVALS.get(interval_minutes, "5min")
         bars = self.alpha_vantage.get_intraday(ticker, interval=av_interval)
 
         if bars:
@@ -363,3 +551,49 @@ class MultiAPIClient:
 
         logging.warning(f"Failed to get intraday bars for {ticker}")
         return []
+
+    def get_intraday_bars_batch(self, tickers: list[str], interval_minutes: int = 5,
+                                limit: int = 120) -> dict[str, list[IntradayBar]]:
+        """
+        Get intraday bars for several tickers, keyed by ticker.
+
+        yfinance serves the whole list in one download; tickers it has no data
+        for go through get_intraday_bars individually, and are left out if
+        every source fails.
+        """
+        if not tickers:
+            return {}
+
+        yf_interval = self.YF_INTERVALS.get(interval_minutes, "5m")
+        batch = self.yfinance.get_intraday_batch(tickers, period="1d", interval=yf_interval)
+
+        result = {}
+        for ticker in tickers:
+            bars = batch.get(ticker) or self.get_intraday_bars(ticker, interval_minutes, limit)
+            if bars:
+                result[ticker] = bars[-limit:]
+        return result
+
+    def get_intraday_series(self, ticker: str, interval_minutes: int = 5, limit: int = 120) -> PriceSeries:
+        """
+        Get intraday bars as OHLCV columns, for callers that only run indicator math.
+
+        Same sources and fallback order as get_intraday_bars, but yfinance data
+        is copied column-wise without building an IntradayBar per row. Returns
+        an empty series when no source has data.
+        """
+        yf_interval = self.YF_INTERVALS.get(interval_minutes, "5m")
+        series = self.yfinance.get_intraday_series(ticker, period="1d", interval=yf_interval)
+
+        if series is not None and len(series):
+            return series[-limit:]
+
+        # Fallback to Alpha Vantage
+        av_interval = self.AV_INTERVALS.get(interval_minutes, "5min")
+        bars = self.alpha_vantage.get_intraday(ticker, interval=av_interval)
+
+        if bars:
+            return PriceSeries.from_prices(bars[-limit:])
+
+        logging.warning(f"Failed to get intraday bars for {ticker}")
+        return PriceSeries.from_prices([])
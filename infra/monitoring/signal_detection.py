@@ -3,10 +3,11 @@ Enhanced signal detection with advanced indicators
 Implements: gap detection, volume velocity, VWAP deviation, multi-timeframe analysis
 """
 import logging
-import math
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Sequence
+
+import numpy as np
 
 from models import Price
 
@@ -21,45 +22,91 @@ class SignalResult:
     priority: str  # "low", "medium", "high", "critical"
 
 
-def calculate_vwap(prices: list[Price]) -> float:
+@dataclass
+class PriceSeries:
+    """
+    OHLCV bars stored column-wise as float64 arrays.
+
+    Indicators reduce over whole columns, so bars are converted once at the
+    ingestion boundary instead of walking Price objects per indicator.
+    Slicing returns a PriceSeries of array views. ``timestamp`` holds bar
+    times as datetime64[ms] (UTC) when the source provides them.
+    """
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    timestamp: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_prices(cls, prices: Sequence) -> "PriceSeries":
+        """Build from Price, IntradayBar or any objects with OHLCV attributes."""
+        return cls.from_rows([(p.open, p.high, p.low, p.close, p.volume) for p in prices])
+
+    @classmethod
+    def from_rows(cls, rows: Sequence, timestamp: Optional[np.ndarray] = None) -> "PriceSeries":
+        """Build from (open, high, low, close, volume) tuples."""
+        table = np.array(rows, dtype=np.float64).reshape(len(rows), 5)
+        columns = np.ascontiguousarray(table.T)
+        return cls(*columns, timestamp=timestamp)
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def __getitem__(self, index: slice) -> "PriceSeries":
+        return PriceSeries(
+            self.open[index], self.high[index], self.low[index], self.close[index], self.volume[index],
+            None if self.timestamp is None else self.timestamp[index],
+        )
+
+
+def _as_series(prices: "list[Price] | PriceSeries") -> PriceSeries:
+    return prices if isinstance(prices, PriceSeries) else PriceSeries.from_prices(prices)
+
+
+def calculate_vwap(prices: list[Price] | PriceSeries) -> float:
     """Calculate Volume Weighted Average Price"""
-    if not prices:
+    prices = _as_series(prices)
+    if not len(prices):
         return 0.0
 
-    total_volume = sum(p.volume for p in prices)
+    total_volume = prices.volume.sum()
     if total_volume == 0:
         return 0.0
 
-    vwap = sum(p.close * p.volume for p in prices) / total_volume
+    vwap = float(prices.close @ prices.volume / total_volume)
     return vwap
 
 
-def calculate_price_velocity(prices: list[Price], lookback_minutes: int = 5) -> float:
+def calculate_price_velocity(prices: list[Price] | PriceSeries, lookback_minutes: int = 5) -> float:
     """Calculate price change per minute over lookback period"""
+    prices = _as_series(prices)
     if len(prices) < 2:
         return 0.0
 
-    latest = prices[-1]
+    latest_close = float(prices.close[-1])
     lookback_idx = max(0, len(prices) - lookback_minutes - 1)
-    previous = prices[lookback_idx]
+    previous_close = float(prices.close[lookback_idx])
 
-    if previous.close == 0:
+    if previous_close == 0:
         return 0.0
 
     time_diff = lookback_minutes if lookback_minutes > 0 else 1
-    price_change = abs(latest.close - previous.close) / previous.close
+    price_change = abs(latest_close - previous_close) / previous_close
     velocity = price_change / time_diff
 
     return velocity
 
 
-def calculate_volume_velocity(prices: list[Price]) -> float:
+def calculate_volume_velocity(prices: list[Price] | PriceSeries) -> float:
     """Calculate current volume rate vs average"""
+    prices = _as_series(prices)
     if len(prices) < 10:
         return 1.0
 
-    latest_volume = prices[-1].volume
-    avg_volume = sum(p.volume for p in prices[-10:-1]) / 9
+    latest_volume = float(prices.volume[-1])
+    avg_volume = float(prices.volume[-10:-1].sum()) / 9
 
     if avg_volume == 0:
         return 1.0
@@ -67,26 +114,23 @@ def calculate_volume_velocity(prices: list[Price]) -> float:
     return latest_volume / avg_volume
 
 
-def calculate_atr(prices: list[Price], period: int = 14) -> float:
+def calculate_atr(prices: list[Price] | PriceSeries, period: int = 14) -> float:
     """Calculate Average True Range"""
-    if len(prices) < period + 1:
+    prices = _as_series(prices)
+    if period < 1 or len(prices) < period + 1:
         return 0.0
 
-    true_ranges = []
-    for i in range(1, len(prices)):
-        high_low = prices[i].high - prices[i].low
-        high_close = abs(prices[i].high - prices[i - 1].close)
-        low_close = abs(prices[i].low - prices[i - 1].close)
-        true_ranges.append(max(high_low, high_close, low_close))
+    # Only the last `period` true ranges contribute, so skip the rest of the history
+    high = prices.high[-period:]
+    low = prices.low[-period:]
+    previous_close = prices.close[-period - 1:-1]
+    true_ranges = np.maximum(high - low, np.maximum(np.abs(high - previous_close), np.abs(low - previous_close)))
 
-    if not true_ranges:
-        return 0.0
-
-    atr = sum(true_ranges[-period:]) / min(period, len(true_ranges))
+    atr = float(true_ranges.sum()) / period
     return atr
 
 
-def calculate_rsi(prices: list[Price], period: int = 14) -> float:
+def calculate_rsi(prices: list[Price] | PriceSeries, period: int = 14) -> float:
     """
     Calculate RSI (Relative Strength Index) locally without API calls
 
@@ -97,24 +141,16 @@ def calculate_rsi(prices: list[Price], period: int = 14) -> float:
     Returns:
         RSI value (0-100), or 50.0 if insufficient data
     """
+    prices = _as_series(prices)
     if len(prices) < period + 1:
         return 50.0  # Neutral
 
-    gains = []
-    losses = []
-
-    for i in range(1, len(prices)):
-        change = prices[i].close - prices[i-1].close
-        if change > 0:
-            gains.append(change)
-            losses.append(0)
-        else:
-            gains.append(0)
-            losses.append(abs(change))
+    # Only the last `period` changes contribute to the averages
+    changes = np.diff(prices.close[-period - 1:])
 
     # Calculate average gain and loss over the period
-    avg_gain = sum(gains[-period:]) / period
-    avg_loss = sum(losses[-period:]) / period
+    avg_gain = float(np.maximum(changes, 0.0).sum()) / period
+    avg_loss = float(np.maximum(-changes, 0.0).sum()) / period
 
     if avg_loss == 0:
         return 100.0  # All gains, maximum RSI
@@ -125,12 +161,12 @@ def calculate_rsi(prices: list[Price], period: int = 14) -> float:
     return round(rsi, 2)
 
 
-def detect_gap(latest: Price, previous_close: float, threshold: float = 0.015) -> Optional[str]:
+def detect_gap(latest_open: float, previous_close: float, threshold: float = 0.015) -> Optional[str]:
     """
     Detect gap at market open
 
     Args:
-        latest: Latest price bar
+        latest_open: Open of the latest price bar
         previous_close: Previous day's close
         threshold: Gap threshold (default 1.5%)
 
@@ -140,7 +176,7 @@ def detect_gap(latest: Price, previous_close: float, threshold: float = 0.015) -
     if previous_close == 0:
         return None
 
-    gap = (latest.open - previous_close) / previous_close
+    gap = (latest_open - previous_close) / previous_close
 
     if gap >= threshold:
         return "gap_up"
@@ -150,7 +186,7 @@ def detect_gap(latest: Price, previous_close: float, threshold: float = 0.015) -
     return None
 
 
-def detect_intraday_breakout(prices: list[Price], lookback_bars: int = 78) -> Optional[str]:
+def detect_intraday_breakout(prices: list[Price] | PriceSeries, lookback_bars: int = 78) -> Optional[str]:
     """
     Detect if price breaks intraday high/low
 
@@ -161,24 +197,22 @@ def detect_intraday_breakout(prices: list[Price], lookback_bars: int = 78) -> Op
     Returns:
         "breakout_high" or "breakout_low" if breakout detected, None otherwise
     """
-    if len(prices) < lookback_bars + 1:
+    prices = _as_series(prices)
+    if lookback_bars < 1 or len(prices) < lookback_bars + 1:
         return None
 
-    historical = prices[-lookback_bars - 1:-1]
-    latest = prices[-1]
-
-    intraday_high = max(p.high for p in historical)
-    intraday_low = min(p.low for p in historical)
+    intraday_high = prices.high[-lookback_bars - 1:-1].max()
+    intraday_low = prices.low[-lookback_bars - 1:-1].min()
 
-    if latest.high > intraday_high:
+    if prices.high[-1] > intraday_high:
         return "breakout_high"
-    elif latest.low < intraday_low:
+    elif prices.low[-1] < intraday_low:
         return "breakout_low"
 
     return None
 
 
-def detect_vwap_deviation(prices: list[Price], std_threshold: float = 2.0) -> Optional[str]:
+def detect_vwap_deviation(prices: list[Price] | PriceSeries, std_threshold: float = 2.0) -> Optional[str]:
     """
     Detect significant deviation from VWAP
 
@@ -189,6 +223,7 @@ def detect_vwap_deviation(prices: list[Price], std_threshold: float = 2.0) -> Op
     Returns:
         "above_vwap" or "below_vwap" if significant deviation, None otherwise
     """
+    prices = _as_series(prices)
     if len(prices) < 20:
         return None
 
@@ -197,12 +232,10 @@ def detect_vwap_deviation(prices: list[Price], std_threshold: float = 2.0) -> Op
         return None
 
     # Calculate standard deviation of price from VWAP
-    deviations = [(p.close - vwap) for p in prices]
-    mean_deviation = sum(deviations) / len(deviations)
-    variance = sum((d - mean_deviation) ** 2 for d in deviations) / len(deviations)
-    std_dev = math.sqrt(variance)
+    deviations = prices.close - vwap
+    std_dev = float(deviations.std())
 
-    latest_price = prices[-1].close
+    latest_price = float(prices.close[-1])
     deviation_zscore = (latest_price - vwap) / std_dev if std_dev > 0 else 0
 
     if deviation_zscore > std_threshold:
@@ -213,23 +246,22 @@ def detect_vwap_deviation(prices: list[Price], std_threshold: float = 2.0) -> Op
     return None
 
 
-def calculate_bollinger_position(prices: list[Price], period: int = 20) -> float:
+def calculate_bollinger_position(prices: list[Price] | PriceSeries, period: int = 20) -> float:
     """
     Calculate where price is relative to Bollinger Bands (0.0 = lower band, 1.0 = upper band)
     """
-    if len(prices) < period:
+    prices = _as_series(prices)
+    if period < 1 or len(prices) < period:
         return 0.5
 
-    recent = prices[-period:]
-    closes = [p.close for p in recent]
-    mean_price = sum(closes) / len(closes)
-    variance = sum((c - mean_price) ** 2 for c in closes) / len(closes)
-    std_dev = math.sqrt(variance)
+    closes = prices.close[-period:]
+    mean_price = float(closes.mean())
+    std_dev = float(closes.std())
 
     upper_band = mean_price + (2 * std_dev)
     lower_band = mean_price - (2 * std_dev)
 
-    latest_price = prices[-1].close
+    latest_price = float(prices.close[-1])
 
     if upper_band == lower_band:
         return 0.5
@@ -238,7 +270,7 @@ def calculate_bollinger_position(prices: list[Price], period: int = 20) -> float
     return max(0.0, min(1.0, position))
 
 
-def detect_volatility_expansion(prices: list[Price], lookback: int = 20, threshold: float = 1.5) -> bool:
+def detect_volatility_expansion(prices: list[Price] | PriceSeries, lookback: int = 20, threshold: float = 1.5) -> bool:
     """
     Detect if volatility is expanding significantly
 
@@ -250,6 +282,7 @@ def detect_volatility_expansion(prices: list[Price], lookback: int = 20, thresho
     Returns:
         True if volatility expanding, False otherwise
     """
+    prices = _as_series(prices)
     if len(prices) < lookback * 2:
         return False
 
@@ -266,8 +299,8 @@ def detect_volatility_expansion(prices: list[Price], lookback: int = 20, thresho
     return atr_ratio >= threshold
 
 
-def check_multi_timeframe_alignment(prices_1m: list[Price], prices_5m: list[Price],
-                                   prices_15m: list[Price]) -> dict:
+def check_multi_timeframe_alignment(prices_1m: list[Price] | PriceSeries, prices_5m: list[Price] | PriceSeries,
+                                   prices_15m: list[Price] | PriceSeries) -> dict:
     """
     Check if trends are aligned across multiple timeframes
 
@@ -284,10 +317,11 @@ def check_multi_timeframe_alignment(prices_1m: list[Price], prices_5m: list[Pric
         return result
 
     # Calculate simple trend for each timeframe (recent vs earlier average)
-    def get_trend_direction(prices: list[Price]) -> int:
+    def get_trend_direction(prices: list[Price] | PriceSeries) -> int:
         """Returns 1 for uptrend, -1 for downtrend, 0 for neutral"""
-        recent_avg = sum(p.close for p in prices[-5:]) / 5
-        earlier_avg = sum(p.close for p in prices[-15:-5]) / 10
+        closes = _as_series(prices).close
+        recent_avg = float(closes[-5:].sum()) / 5
+        earlier_avg = float(closes[-15:-5].sum()) / 10
 
         if recent_avg > earlier_avg * 1.005:  # 0.5% threshold
             return 1
@@ -314,7 +348,7 @@ def check_multi_timeframe_alignment(prices_1m: list[Price], prices_5m: list[Pric
 
 def enhanced_signal_detection(
     ticker: str,
-    prices: list[Price],
+    prices: list[Price] | PriceSeries,
     previous_day_close: float = None,
     percent_threshold: float = 0.02,
     volume_multiplier: float = 1.5,
@@ -326,7 +360,7 @@ def enhanced_signal_detection(
 
     Args:
         ticker: Stock ticker
-        prices: Price history (should be intraday bars)
+        prices: Price history (should be intraday bars), as Price objects or a PriceSeries
         previous_day_close: Previous day's closing price for gap detection
         percent_threshold: Price change threshold (default 2%)
         volume_multiplier: Volume spike threshold (default 1.5x)
@@ -345,16 +379,19 @@ def enhanced_signal_detection(
             priority="low"
         )
 
-    latest = prices[-1]
-    previous = prices[-2]
+    # Convert once; every indicator below reads the same columns
+    prices = _as_series(prices)
+    latest_open = float(prices.open[-1])
+    latest_close = float(prices.close[-1])
+    previous_close = float(prices.close[-2])
 
     reasons = []
     confidence_scores = []
     metrics = {}
 
     # 1. Basic price change detection
-    if previous.close > 0:
-        percent_change = (latest.close - previous.close) / previous.close
+    if previous_close > 0:
+        percent_change = (latest_close - previous_close) / previous_close
         metrics["percent_change"] = round(percent_change * 100, 2)
 
         if abs(percent_change) >= percent_threshold:
@@ -380,10 +417,10 @@ def enhanced_signal_detection(
 
     # 4. Gap detection (if previous close provided)
     if previous_day_close and previous_day_close > 0:
-        gap_signal = detect_gap(latest, previous_day_close, threshold=0.015)
+        gap_signal = detect_gap(latest_open, previous_day_close, threshold=0.015)
         if gap_signal:
             reasons.append(gap_signal)
-            gap_pct = abs(latest.open - previous_day_close) / previous_day_close
+            gap_pct = abs(latest_open - previous_day_close) / previous_day_close
             metrics["gap_percent"] = round(gap_pct * 100, 2)
             confidence_scores.append(min(gap_pct / 0.02, 1.0) * 0.95)
 
@@ -399,7 +436,7 @@ def enhanced_signal_detection(
     if vwap_signal:
         reasons.append(vwap_signal)
         metrics["vwap"] = round(vwap, 2)
-        metrics["vwap_deviation"] = round((latest.close - vwap) / vwap * 100, 2)
+        metrics["vwap_deviation"] = round((latest_close - vwap) / vwap * 100, 2)
         confidence_scores.append(0.75)
 
     # 7. Bollinger Band position
@@ -417,8 +454,8 @@ def enhanced_signal_detection(
 
     # 9. ATR calculation
     atr = calculate_atr(prices)
-    if latest.close > 0:
-        atr_percent = (atr / latest.close) * 100
+    if latest_close > 0:
+        atr_percent = (atr / latest_close) * 100
         metrics["atr_percent"] = round(atr_percent, 2)
 
     # Calculate overall confidence
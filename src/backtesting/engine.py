@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from typing import Sequence, Dict
 
@@ -19,6 +20,7 @@ from src.tools.api import (
     get_company_news,
     get_price_data,
     get_prices,
+    get_prices_batch,
     get_financial_metrics,
     get_insider_trades,
 )
@@ -83,8 +85,10 @@ class BacktestEngine:
         start_date_dt = end_date_dt - relativedelta(years=1)
         start_date_str = start_date_dt.strftime("%Y-%m-%d")
 
+        # Prices are the widest fetch; pull them for all tickers concurrently
+        asyncio.run(get_prices_batch(self._tickers, start_date_str, self._end_date))
+
         for ticker in self._tickers:
-            get_prices(ticker, start_date_str, self._end_date)
             get_financial_metrics(ticker, self._end_date, limit=10)
             get_insider_trades(ticker, self._end_date, start_date=self._start_date, limit=1000)
             get_company_news(ticker, self._end_date, start_date=self._start_date, limit=1000)
@@ -1,8 +1,13 @@
+import asyncio
 import datetime
 import os
+import httpx
 import pandas as pd
+import random
 import requests
 import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.data.cache import get_cache
 from src.utils.ssl_utils import patch_requests_session
@@ -27,10 +32,57 @@ _cache = get_cache()
 _session = requests.Session()
 patch_requests_session(_session)
 
+# Gateway errors worth retrying, on both the sync session and the async path
+_RETRY_STATUSES = (502, 503, 504)
+
+# Keep-alive pool sized for multi-ticker runs; transient gateway errors are
+# retried by urllib3, while 429s are handled by _make_api_request's cooldown.
+# urllib3 would otherwise retry any 429 carrying Retry-After on its own, so
+# Retry-After is ignored here and every 429 reaches _make_api_request.
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "POST"}),
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    ),
+))
+
+
+# Monotonic deadline of the last 429 cooldown. New requests wait it out
+# instead of each hitting the rate limit on their own.
+_rate_limited_until = 0.0
+
+
+def _retry_delay(response, attempt: int) -> float:
+    """
+    Seconds to wait after a 429: the server's Retry-After hint when it sends
+    one in seconds, otherwise exponential backoff capped at 60s, plus up to
+    2s of jitter so parallel workers don't retry in lockstep.
+    """
+    try:
+        delay = float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        delay = min(60, 2 ** attempt)
+    return delay + random.uniform(0, 2)
+
+
+def _start_cooldown(delay: float) -> None:
+    global _rate_limited_until
+    _rate_limited_until = max(_rate_limited_until, time.monotonic() + delay)
+
+
+def _cooldown_remaining() -> float:
+    return _rate_limited_until - time.monotonic()
+
 
 def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: dict = None, max_retries: int = 3) -> requests.Response:
     """
-    Make an API request with rate limiting handling and moderate backoff.
+    Make an API request with rate limiting handling and exponential backoff.
     
     Args:
         url: The URL to request
@@ -45,6 +97,9 @@ def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: d
     Raises:
         Exception: If the request fails with a non-429 error
     """
+    if (wait := _cooldown_remaining()) > 0:
+        time.sleep(wait)
+
     for attempt in range(max_retries + 1):  # +1 for initial attempt
         if method.upper() == "POST":
             response = _session.post(url, headers=headers, json=json_data)
@@ -52,9 +107,9 @@ def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: d
             response = _session.get(url, headers=headers)
         
         if response.status_code == 429 and attempt < max_retries:
-            # Linear backoff: 60s, 90s, 120s, 150s...
-            delay = 60 + (30 * attempt)
-            print(f"Rate limited (429). Attempt {attempt + 1}/{max_retries + 1}. Waiting {delay}s before retrying...")
+            delay = _retry_delay(response, attempt)
+            _start_cooldown(delay)
+            print(f"Rate limited (429). Attempt {attempt + 1}/{max_retries + 1}. Waiting {delay:.1f}s before retrying...")
             time.sleep(delay)
             continue
         
@@ -62,6 +117,38 @@ def _make_api_request(url: str, headers: dict, method: str = "GET", json_data: d
         return response
 
 
+async def _make_api_request_async(client: httpx.AsyncClient, url: str, headers: dict, max_retries: int = 3) -> httpx.Response:
+    """
+    Async GET counterpart of _make_api_request, with the same 429 backoff.
+
+    Gateway errors are retried here too, with the exponential backoff the
+    sync session's urllib3 Retry applies; connection-level retries come from
+    the client's transport.
+    """
+    if (wait := _cooldown_remaining()) > 0:
+        await asyncio.sleep(wait)
+
+    for attempt in range(max_retries + 1):  # +1 for initial attempt
+        response = await client.get(url, headers=headers)
+
+        if response.status_code == 429 and attempt < max_retries:
+            delay = _retry_delay(response, attempt)
+            _start_cooldown(delay)
+            print(f"Rate limited (429). Attempt {attempt + 1}/{max_retries + 1}. Waiting {delay:.1f}s before retrying...")
+            await asyncio.sleep(delay)
+            continue
+
+        if response.status_code in _RETRY_STATUSES and attempt < max_retries:
+            await asyncio.sleep(2 ** attempt)
+            continue
+
+        return response
+
+
+def _prices_url(ticker: str, start_date: str, end_date: str) -> str:
+    return f"https://api.financialdatasets.ai/prices/?ticker={ticker}&interval=day&interval_multiplier=1&start_date={start_date}&end_date={end_date}"
+
+
 def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None) -> list[Price]:
     """Fetch price data from cache or API."""
     # Create a cache key that includes all parameters to ensure exact matches
@@ -77,14 +164,15 @@ def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None)
     if financial_api_key:
         headers["X-API-KEY"] = financial_api_key
 
-    url = f"https://api.financialdatasets.ai/prices/?ticker={ticker}&interval=day&interval_multiplier=1&start_date={start_date}&end_date={end_date}"
+    url = _prices_url(ticker, start_date, end_date)
     response = _make_api_request(url, headers)
     if response.status_code != 200:
         return []
 
-    # Parse response with Pydantic model
+    # Parse the raw body straight into the Pydantic model; price payloads run
+    # to thousands of bars, so skipping the intermediate dict matters here
     try:
-        price_response = PriceResponse(**response.json())
+        price_response = PriceResponse.model_validate_json(response.content)
         prices = price_response.prices
     except:
         return []
@@ -97,6 +185,65 @@ def get_prices(ticker: str, start_date: str, end_date: str, api_key: str = None)
     return prices
 
 
+async def get_prices_batch(
+    tickers: list[str],
+    start_date: str,
+    end_date: str,
+    api_key: str = None,
+    max_concurrency: int = 8,
+) -> dict[str, list[Price]]:
+    """
+    Fetch prices for several tickers concurrently.
+
+    Requests share one keep-alive connection pool and at most
+    ``max_concurrency`` are in flight at once. Results go through the same
+    cache as get_prices, so later get_prices calls for these tickers are hits.
+    A ticker whose request fails maps to an empty list; callers fall back to
+    get_prices for it.
+    """
+    headers = {}
+    financial_api_key = api_key or os.environ.get("FINANCIAL_DATASETS_API_KEY")
+    if financial_api_key:
+        headers["X-API-KEY"] = financial_api_key
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(client: httpx.AsyncClient, ticker: str) -> list[Price]:
+        cache_key = f"{ticker}_{start_date}_{end_date}"
+        if cached_data := _cache.get_prices(cache_key):
+            return [Price(**price) for price in cached_data]
+
+        try:
+            async with semaphore:
+                response = await _make_api_request_async(client, _prices_url(ticker, start_date, end_date), headers)
+        except httpx.HTTPError as e:
+            print(f"Error fetching prices for {ticker}: {e}")
+            return []
+        if response.status_code != 200:
+            return []
+
+        try:
+            prices = PriceResponse.model_validate_json(response.content).prices
+        except:
+            return []
+
+        if not prices:
+            return []
+
+        _cache.set_prices(cache_key, [p.model_dump() for p in prices])
+        return prices
+
+    # TLS settings and pool limits belong to the transport once one is given
+    transport = httpx.AsyncHTTPTransport(
+        verify=_session.verify,
+        limits=httpx.Limits(max_connections=max_concurrency),
+        retries=3,
+    )
+    async with httpx.AsyncClient(timeout=30, transport=transport) as client:
+        results = await asyncio.gather(*(fetch(client, ticker) for ticker in tickers))
+    return dict(zip(tickers, results))
+
+
 def get_financial_metrics(
     ticker: str,
     end_date: str,
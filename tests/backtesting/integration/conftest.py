@@ -108,6 +108,9 @@ def _load_insider_from_fixture(ticker: str, start: str | None, end: str, limit:
 def patch_engine_prices(monkeypatch):
     # No-op non-price endpoints
     monkeypatch.setattr("src.backtesting.engine.get_prices", lambda *a, **k: None)
+    async def _fake_get_prices_batch(*a, **k):
+        return {}
+    monkeypatch.setattr("src.backtesting.engine.get_prices_batch", _fake_get_prices_batch)
     def _fake_get_financial_metrics(ticker: str, end_date: str, period: str = "ttm", limit: int = 10, api_key: str | None = None):
         return _load_financial_metrics_from_fixture(ticker, end_date, limit)
     monkeypatch.setattr("src.backtesting.engine.get_financial_metrics", _fake_get_financial_metrics)
@@ -1,14 +1,32 @@
+import asyncio
+import json
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
 import pytest
-from unittest.mock import Mock, patch, call
+from unittest.mock import AsyncMock, Mock, patch, call
 
-from src.tools.api import _make_api_request, get_prices
+import src.tools.api as api
+from src.data.cache import Cache
+from src.tools.api import _make_api_request, get_prices, get_prices_batch
 
 class TestRateLimiting:
     """Test suite for API rate limiting functionality."""
 
+    def setup_method(self):
+        # Sleeps are mocked, so clear any cooldown left by a previous test
+        api._rate_limited_until = 0.0
+        # Remove jitter so backoff delays are deterministic
+        self._jitter = patch('src.tools.api.random.uniform', return_value=0)
+        self._jitter.start()
+
+    def teardown_method(self):
+        self._jitter.stop()
+
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.api._session.get')
     def test_handles_single_rate_limit(self, mock_get, mock_sleep):
         """Test that API retries once after a 429 and succeeds."""
         # Setup mock responses: first 429, then 200
@@ -38,11 +56,11 @@ class TestRateLimiting:
             call(url, headers=headers)
         ])
         
-        # Verify sleep was called once with 60 seconds (first retry)
-        mock_sleep.assert_called_once_with(60)
+        # Verify sleep was called once with 1 second (first retry)
+        mock_sleep.assert_called_once_with(1)
 
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.api._session.get')
     def test_handles_multiple_rate_limits(self, mock_get, mock_sleep):
         """Test that API retries multiple times after 429s."""
         # Setup mock responses: three 429s, then 200
@@ -73,13 +91,13 @@ class TestRateLimiting:
         # Verify requests.get was called 4 times
         assert mock_get.call_count == 4
         
-        # Verify sleep was called 3 times with linear backoff: 60s, 90s, 120s
+        # Verify sleep was called 3 times with exponential backoff: 1s, 2s, 4s
         assert mock_sleep.call_count == 3
-        expected_calls = [call(60), call(90), call(120)]
+        expected_calls = [call(1), call(2), call(4)]
         mock_sleep.assert_has_calls(expected_calls)
 
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.post')
+    @patch('src.tools.api._session.post')
     def test_handles_post_rate_limiting(self, mock_post, mock_sleep):
         """Test that POST requests handle rate limiting."""
         # Setup mock responses: first 429, then 200
@@ -110,11 +128,11 @@ class TestRateLimiting:
             call(url, headers=headers, json=json_data)
         ])
         
-        # Verify sleep was called once with 60 seconds (first retry)
-        mock_sleep.assert_called_once_with(60)
+        # Verify sleep was called once with 1 second (first retry)
+        mock_sleep.assert_called_once_with(1)
 
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.api._session.get')
     def test_ignores_other_errors(self, mock_get, mock_sleep):
         """Test that non-429 errors are returned without retrying."""
         # Setup mock response: 500 error
@@ -141,7 +159,7 @@ class TestRateLimiting:
         mock_sleep.assert_not_called()
 
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.api._session.get')
     def test_normal_success_requests(self, mock_get, mock_sleep):
         """Test that successful requests return immediately without retry."""
         # Setup mock response: 200 success
@@ -169,7 +187,7 @@ class TestRateLimiting:
 
     @patch('src.tools.api._cache')
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.api._session.get')
     def test_full_integration(self, mock_get, mock_sleep, mock_cache):
         """Test that get_prices function properly handles rate limiting."""
         # Mock cache to return None (cache miss)
@@ -181,7 +199,7 @@ class TestRateLimiting:
         
         mock_200_response = Mock()
         mock_200_response.status_code = 200
-        mock_200_response.json.return_value = {
+        mock_200_response.content = json.dumps({
             "ticker": "AAPL",
             "prices": [
                 {
@@ -193,7 +211,7 @@ class TestRateLimiting:
                     "volume": 1000
                 }
             ]
-        }
+        }).encode()
         
         mock_get.side_effect = [mock_429_response, mock_200_response]
         
@@ -209,14 +227,14 @@ class TestRateLimiting:
         
         # Verify rate limiting behavior
         assert mock_get.call_count == 2
-        mock_sleep.assert_called_once_with(60)
+        mock_sleep.assert_called_once_with(1)
         
         # Verify cache operations
         mock_cache.get_prices.assert_called_once()
         mock_cache.set_prices.assert_called_once()
 
     @patch('src.tools.api.time.sleep')
-    @patch('src.tools.api.requests.get')
+    @patch('src.tools.api._session.get')
     def test_max_retries_exceeded(self, mock_get, mock_sleep):
         """Test that function stops retrying after max_retries and returns final 429."""
         # Setup mock responses: all 429s (exceeds max retries)
@@ -239,11 +257,156 @@ class TestRateLimiting:
         # Verify requests.get was called 3 times (1 initial + 2 retries)
         assert mock_get.call_count == 3
         
-        # Verify sleep was called 2 times with linear backoff: 60s, 90s
+        # Verify sleep was called 2 times with exponential backoff: 1s, 2s
         assert mock_sleep.call_count == 2
-        expected_calls = [call(60), call(90)]
+        expected_calls = [call(1), call(2)]
         mock_sleep.assert_has_calls(expected_calls)
 
+    @patch('src.tools.api.time.sleep')
+    @patch('src.tools.api._session.get')
+    def test_honors_retry_after_header(self, mock_get, mock_sleep):
+        """Test that the server's Retry-After hint replaces the computed backoff."""
+        mock_429_response = Mock()
+        mock_429_response.status_code = 429
+        mock_429_response.headers = {"Retry-After": "5"}
+
+        mock_200_response = Mock()
+        mock_200_response.status_code = 200
+
+        mock_get.side_effect = [mock_429_response, mock_200_response]
+
+        result = _make_api_request("https://api.financialdatasets.ai/test", {"X-API-KEY": "test-key"})
+
+        assert result.status_code == 200
+        mock_sleep.assert_called_once_with(5.0)
+
+    @patch('src.tools.api.time.sleep')
+    @patch('src.tools.api._session.get')
+    def test_waits_out_active_cooldown(self, mock_get, mock_sleep):
+        """Test that a new request waits for a cooldown started by another caller."""
+        mock_200_response = Mock()
+        mock_200_response.status_code = 200
+        mock_get.return_value = mock_200_response
+
+        with patch('src.tools.api.time.monotonic', return_value=100.0):
+            api._rate_limited_until = 130.0
+            result = _make_api_request("https://api.financialdatasets.ai/test", {"X-API-KEY": "test-key"})
+
+        assert result.status_code == 200
+        mock_sleep.assert_called_once_with(30.0)
+        assert mock_get.call_count == 1
+
+    @patch('src.tools.api.time.sleep')
+    def test_session_adapter_leaves_429s_to_caller(self, mock_sleep):
+        """Test that a 429 with Retry-After passes the mounted adapter once per attempt."""
+        hits = []
+
+        class Always429(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                self.send_response(429)
+                self.send_header("Retry-After", "0")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Always429)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_port}"
+        # Route the local plain-HTTP server through the production adapter
+        api._session.mount(base_url, api._session.get_adapter("https://api.financialdatasets.ai"))
+        try:
+            result = _make_api_request(f"{base_url}/test", {"X-API-KEY": "test-key"}, max_retries=2)
+        finally:
+            del api._session.adapters[base_url]
+            server.shutdown()
+            server.server_close()
+
+        assert result.status_code == 429
+        assert len(hits) == 3
+        assert mock_sleep.call_count == 2
+
+
+class TestPricesBatch:
+    """Test suite for the concurrent get_prices_batch cache warm-up."""
+
+    PRICE = {"open": 100.0, "close": 101.0, "high": 102.0, "low": 99.0, "volume": 1000, "time": "2024-01-02T00:00:00Z"}
+
+    def setup_method(self):
+        api._rate_limited_until = 0.0
+        self._patches = [
+            patch('src.tools.api.random.uniform', return_value=0),
+            patch('src.tools.api._cache', Cache()),
+        ]
+        for p in self._patches:
+            p.start()
+
+    def teardown_method(self):
+        for p in self._patches:
+            p.stop()
+
+    def _run(self, handler, tickers):
+        """Run get_prices_batch against ``handler`` through the real async retry loop."""
+        transport = httpx.MockTransport(handler)
+        with patch('src.tools.api.httpx.AsyncHTTPTransport', return_value=transport), \
+                patch('src.tools.api.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            result = asyncio.run(get_prices_batch(tickers, "2024-01-01", "2024-01-31", api_key="test-key"))
+        return result, mock_sleep
+
+    def _prices_response(self, request):
+        ticker = request.url.params["ticker"]
+        return httpx.Response(200, json={"ticker": ticker, "prices": [self.PRICE]})
+
+    def test_fills_cache(self):
+        """Test that fetched prices are cached so get_prices needs no request."""
+        result, _ = self._run(self._prices_response, ["AAPL", "MSFT"])
+
+        assert [p.close for p in result["AAPL"]] == [101.0]
+        assert [p.close for p in result["MSFT"]] == [101.0]
+        with patch('src.tools.api._session.get') as mock_get:
+            prices = get_prices("AAPL", "2024-01-01", "2024-01-31")
+        mock_get.assert_not_called()
+        assert prices[0].close == 101.0
+
+    def test_backs_off_on_rate_limit(self):
+        """Test that a 429 waits out Retry-After and then retries."""
+        responses = iter([httpx.Response(429, headers={"Retry-After": "5"})])
+
+        def handler(request):
+            return next(responses, None) or self._prices_response(request)
+
+        result, mock_sleep = self._run(handler, ["AAPL"])
+
+        assert result["AAPL"][0].close == 101.0
+        mock_sleep.assert_awaited_once_with(5.0)
+
+    def test_retries_gateway_errors(self):
+        """Test that 502/503/504 are retried like the sync session does."""
+        responses = iter([httpx.Response(503), httpx.Response(502)])
+
+        def handler(request):
+            return next(responses, None) or self._prices_response(request)
+
+        result, mock_sleep = self._run(handler, ["AAPL"])
+
+        assert result["AAPL"][0].close == 101.0
+        assert mock_sleep.await_count == 2
+
+    def test_failing_ticker_leaves_cache_miss(self):
+        """Test that a connection error on one ticker does not abort the batch."""
+        def handler(request):
+            if request.url.params["ticker"] == "FAIL":
+                raise httpx.ConnectError("connection refused", request=request)
+            return self._prices_response(request)
+
+        result, _ = self._run(handler, ["AAPL", "FAIL"])
+
+        assert result["FAIL"] == []
+        assert result["AAPL"][0].close == 101.0
+        assert api._cache.get_prices("FAIL_2024-01-01_2024-01-31") is None
+
 
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
@@ -0,0 +1,135 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from app.backend.services.response_cache import ttl_cache
+
+
+class TestTtlCache:
+    """Test suite for the ttl_cache decorator on async endpoints."""
+
+    def test_concurrent_misses_share_one_call(self):
+        """Test that simultaneous misses on one key make a single upstream call."""
+        calls = []
+
+        @ttl_cache(ttl=60)
+        async def load(days):
+            calls.append(days)
+            await asyncio.sleep(0.01)
+            return {"days": days}
+
+        async def run():
+            return await asyncio.gather(*(load(30) for _ in range(5)))
+
+        results = asyncio.run(run())
+
+        assert calls == [30]
+        assert results == [{"days": 30}] * 5
+
+    def test_hit_within_ttl_and_refetch_after_expiry(self):
+        """Test that results are reused until the TTL passes."""
+        calls = []
+
+        @ttl_cache(ttl=10)
+        async def load(days):
+            calls.append(days)
+            return len(calls)
+
+        async def run():
+            with patch('app.backend.services.response_cache.time.monotonic', return_value=100.0):
+                first = await load(30)
+                second = await load(30)
+            with patch('app.backend.services.response_cache.time.monotonic', return_value=111.0):
+                third = await load(30)
+            return first, second, third
+
+        assert asyncio.run(run()) == (1, 1, 2)
+
+    def test_exceptions_are_not_cached(self):
+        """Test that a failed call propagates and the next call retries."""
+        calls = []
+
+        @ttl_cache(ttl=60)
+        async def load():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("upstream down")
+            return "ok"
+
+        async def run():
+            with pytest.raises(RuntimeError):
+                await load()
+            return await load()
+
+        assert asyncio.run(run()) == "ok"
+        assert len(calls) == 2
+
+    def test_cancelled_caller_does_not_cancel_shared_call(self):
+        """Test that cancelling one waiter leaves the shared call running for the others."""
+        calls = []
+        release = None
+
+        @ttl_cache(ttl=60)
+        async def load():
+            calls.append(1)
+            await release.wait()
+            return "done"
+
+        async def run():
+            nonlocal release
+            release = asyncio.Event()
+            first = asyncio.ensure_future(load())
+            second = asyncio.ensure_future(load())
+            await asyncio.sleep(0)
+            first.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            result = await second
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            # The shared result was cached despite the cancellation
+            return result, await load()
+
+        assert asyncio.run(run()) == ("done", "done")
+        assert len(calls) == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest unused entry is dropped once maxsize is reached."""
+        calls = []
+
+        @ttl_cache(ttl=60, maxsize=2)
+        async def load(key):
+            calls.append(key)
+            return key
+
+        async def run():
+            for key in ("a", "b", "a", "c", "a", "b"):
+                await load(key)
+
+        asyncio.run(run())
+
+        # "a" was refreshed before "c" arrived, so "b" was evicted and refetched
+        assert calls == ["a", "b", "c", "b"]
+
+    def test_ignore_and_unless(self):
+        """Test that ignored kwargs don't split the key and ``unless`` bypasses the cache."""
+        calls = []
+
+        @ttl_cache(ttl=60, ignore=("service",), unless=lambda kwargs: kwargs.get("ticker"))
+        async def load(limit=50, ticker=None, service=None):
+            calls.append((limit, ticker))
+            return len(calls)
+
+        async def run():
+            await load(limit=50, service=object())
+            await load(limit=50, service=object())
+            await load(limit=50, ticker="AAPL")
+            await load(limit=50, ticker="AAPL")
+
+        asyncio.run(run())
+
+        assert calls == [(50, None), (50, "AAPL"), (50, "AAPL")]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])